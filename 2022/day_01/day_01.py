@@ -1,6 +1,10 @@
 """Day 1: Calorie Counting"""
 
+import heapq
+import io
+from itertools import chain
 from pathlib import Path
+from typing import TextIO
 
 test_content = """
 1000
@@ -21,18 +25,32 @@ test_content = """
 
 
 class CalorieCounter:
-    def __init__(self, calories: str):
-        # Remove whitespace
-        calories = calories.strip()
-        # Split data and convert strings to integer
-        self.elves = [x.split("\n") for x in calories.split("\n\n")]
-        self.elves = [[int(x) for x in elf] for elf in self.elves]
-        # Compute sum for each elf
-        self.sums = [sum(x) for x in self.elves]
+    def __init__(self, calories: str | TextIO, k: int = 3):
+        # Read from a file handle (or any iterable of lines) in one pass and
+        # only keep the k largest sums of all elves in a min-heap
+        if isinstance(calories, str):
+            calories = io.StringIO(calories.strip())
+        self.k = k
+        self.largest = []
+        total = None
+        for line in chain(calories, [""]):
+            if line.strip():
+                total = (total or 0) + int(line)
+            elif total is not None:
+                self._add(total)
+                total = None
+
+    def _add(self, total: int) -> None:
+        if len(self.largest) < self.k:
+            heapq.heappush(self.largest, total)
+        else:
+            heapq.heappushpop(self.largest, total)
 
     def top(self, n: int = 1) -> int:
         """Return the sum of the top n calorie counts across all elves."""
-        return sum(sorted(self.sums)[-n:])
+        if n > self.k:
+            raise ValueError(f"Only the top {self.k} counts are kept.")
+        return sum(heapq.nlargest(n, self.largest))
 
     def solve_part1(self) -> int:
         return self.top(1)
@@ -47,7 +65,7 @@ if __name__ == "__main__":
     assert test_counter.solve_part2() == 45000
 
     file = Path(__file__).parent / "input.txt"
-    content = file.read_text()
-    counter = CalorieCounter(content)
+    with file.open() as f:
+        counter = CalorieCounter(f)
     print(f"Part 1: {counter.solve_part1()}")
     print(f"Part 2: {counter.solve_part2()}")
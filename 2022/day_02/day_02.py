@@ -1,5 +1,6 @@
 """Day 2: Rock Paper Scissors"""
 
+from operator import mul
 from pathlib import Path
 
 test_content = """
@@ -9,44 +10,41 @@ C Z
 """
 
 
+# Every round is one of nine lines (A=Rock, B=Paper, C=Scissors for player 1)
+LINES = [f"{p1} {p2}".encode() for p1 in "ABC" for p2 in "XYZ"]
+
+
+def get_points(p1: int, p2: int) -> int:
+    """Return the points of player 2 for the shapes p1 and p2, where 0=Rock,
+    1=Paper and 2=Scissors."""
+    # A shape wins against the previous one (cyclic)
+    return p2 + 1 + 3 * ((p2 - p1 + 1) % 3)
+
+
+# Points of player 2 for each of the nine lines (in order of LINES). With the
+# first strategy, X, Y and Z are the shape of player 2. With the second one,
+# they mean that player 2 has to lose, draw or win.
+STRATEGY_POINTS = (
+    [get_points(p1, x) for p1 in range(3) for x in range(3)],
+    [get_points(p1, (p1 + x - 1) % 3) for p1 in range(3) for x in range(3)],
+)
+
+
 class RockPaperScissors:
-    # Key wins against value (A=Rock, B=Paper, C=Scissors)
-    win = {"A": "C", "C": "B", "B": "A"}
-    # Base points awarded to Player 2
-    base_points = {"A": 1, "B": 2, "C": 3}
-
-    def __init__(self, play: str):
-        self.rounds = [x.split() for x in play.strip().split("\n")]
-
-    def get_points(self, p1: str, p2: str) -> int:
-        total = self.base_points[p2]
-        if p1 == p2:
-            total += 3
-        elif p1 == self.win[p2]:
-            total += 6
-        return total
+    def __init__(self, play: str | bytes):
+        # Lines cannot overlap, so each of them is simply counted in the raw
+        # input and scoring any number of rounds takes just nine steps
+        data = play.encode() if isinstance(play, str) else play
+        self.counts = [data.count(line) for line in LINES]
+
+    def score(self, points: list[int]) -> int:
+        return sum(map(mul, self.counts, points))
 
     def solve_part1(self) -> int:
-        total = 0
-        for p1, p2 in self.rounds:
-            p2 = {"X": "A", "Y": "B", "Z": "C"}[p2]
-            total += self.get_points(p1, p2)
-        return total
+        return self.score(STRATEGY_POINTS[0])
 
     def solve_part2(self) -> int:
-        lose = {val: key for key, val in self.win.items()}
-        total = 0
-
-        for p1, p2 in self.rounds:
-            if p2 == "X":
-                p2 = self.win[p1]
-            elif p2 == "Y":
-                p2 = p1
-            else:
-                p2 = lose[p1]
-            total += self.get_points(p1, p2)
-
-        return total
+        return self.score(STRATEGY_POINTS[1])
 
 
 if __name__ == "__main__":
@@ -55,7 +53,7 @@ if __name__ == "__main__":
     assert test_game.solve_part2() == 12
 
     file = Path(__file__).parent / "input.txt"
-    content = file.read_text()
+    content = file.read_bytes()
     game = RockPaperScissors(content)
     print(f"Part 1: {game.solve_part1()}")
     print(f"Part 2: {game.solve_part2()}")
@@ -2,6 +2,8 @@
 
 import string
 from collections.abc import Iterator
+from functools import reduce
+from operator import or_
 from pathlib import Path
 
 test_content = """
@@ -14,36 +16,52 @@ CrZsJsPPZsGzwwsLwLmpwMDw
 """
 
 
-class RucksackReorganizer:
-    abc = string.ascii_lowercase + string.ascii_uppercase
+ITEM_TYPES = (string.ascii_lowercase + string.ascii_uppercase).encode()
+# Translation table from an item (byte) to a mask with the bit of its item
+# type, where the bit length of the mask is the priority of the item
+ITEM_BITS = [
+    1 << ITEM_TYPES.index(item) if item in ITEM_TYPES else 0
+    for item in range(256)
+]
 
-    def __init__(self, content: str):
-        self.rucksacks = content.strip().split("\n")
 
-    def get_priority(self, item: str) -> int:
-        return self.abc.index(item) + 1
+def item_mask(items: bytes) -> int:
+    """Return the mask of all item types in items."""
+    return reduce(or_, map(ITEM_BITS.__getitem__, items), 0)
 
-    def solve_part1(self) -> int:
-        total = 0
-        for rucksack in self.rucksacks:
+
+def get_priority(mask: int) -> int:
+    """Return the total priority of all item types in mask."""
+    total = 0
+    while mask:
+        priority = mask.bit_length()
+        total += priority
+        mask ^= 1 << (priority - 1)
+    return total
+
+
+class RucksackReorganizer:
+    def __init__(self, content: str | bytes):
+        # The whole input is processed as one buffer of bytes, and every
+        # rucksack is stored as the item masks of its two compartments
+        data = content.encode() if isinstance(content, str) else content
+        self.compartments = []
+        for rucksack in data.split():
             n = len(rucksack) // 2
-            a, b = set(rucksack[:n]), set(rucksack[n:])
-            common_items = a.intersection(b)
-            for item in common_items:
-                total += self.get_priority(item)
-        return total
+            self.compartments.append(
+                (item_mask(rucksack[:n]), item_mask(rucksack[n:]))
+            )
+
+    def solve_part1(self) -> int:
+        return sum(get_priority(a & b) for a, b in self.compartments)
 
-    def groups(self) -> Iterator[list[str]]:
-        for i in range(0, len(self.rucksacks), 3):
-            yield self.rucksacks[i : i + 3]
+    def groups(self) -> Iterator[tuple[int, int, int]]:
+        """Iterate over the item masks of the rucksacks in groups of three."""
+        rucksacks = (a | b for a, b in self.compartments)
+        return zip(rucksacks, rucksacks, rucksacks, strict=True)
 
     def solve_part2(self) -> int:
-        total = 0
-        for group in self.groups():
-            common_items = set.intersection(*map(set, group))
-            for item in common_items:
-                total += self.get_priority(item)
-        return total
+        return sum(get_priority(a & b & c) for a, b, c in self.groups())
 
 
 if __name__ == "__main__":
@@ -52,7 +70,7 @@ if __name__ == "__main__":
     assert test_organizer.solve_part2() == 70
 
     file = Path(__file__).parent / "input.txt"
-    content = file.read_text()
+    content = file.read_bytes()
 
     organizer = RucksackReorganizer(content)
     print(f"Part 1: {organizer.solve_part1()}")
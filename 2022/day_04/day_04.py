@@ -1,5 +1,8 @@
 """Day 4: Camp Cleanup"""
 
+import re
+from array import array
+from collections.abc import Iterator
 from pathlib import Path
 
 test_content = """
@@ -14,30 +17,44 @@ test_content = """
 
 class CampCleaner:
     def __init__(self, content: str):
-        pairs = content.strip().split("\n")
-        self.pairs = [self._process_pair(pair) for pair in pairs]
+        # Every pair is stored as four consecutive integers a0, a1, b0, b1,
+        # so the cost does not depend on the length of the ranges
+        self.sections = array("q", map(int, re.findall(r"\d+", content)))
 
-    @staticmethod
-    def _process_pair(pair: str) -> tuple[set[int], set[int]]:
-        pair = [x.split("-") for x in pair.split(",")]
-        a, b = (set(range(int(x[0]), int(x[1]) + 1)) for x in pair)
-        return a, b
+    def pairs(self) -> Iterator[tuple[int, int, int, int]]:
+        sections = iter(self.sections)
+        return zip(sections, sections, sections, sections, strict=True)
 
     def solve_part1(self) -> int:
         """Count number of pairs, where one range is fully contained in the
         other."""
-        total = 0
-        for a, b in self.pairs:
-            if a.issubset(b) or a.issuperset(b):
-                total += 1
-        return total
+        return sum(
+            (a0 <= b0 and b1 <= a1) or (b0 <= a0 and a1 <= b1)
+            for a0, a1, b0, b1 in self.pairs()
+        )
 
     def solve_part2(self) -> int:
         """Count number of pairs that have overlapping ranges."""
+        return sum(a0 <= b1 and b0 <= a1 for a0, a1, b0, b1 in self.pairs())
+
+    def count_overlaps(self) -> int:
+        """Count all pairs of assignments (of any elves) that overlap.
+
+        Sweep over the start and end points of all ranges in order: Every
+        range that starts overlaps all ranges that are still open. Ranges are
+        inclusive, so starts are processed before ends at the same section.
+        """
+        events = sorted(
+            (section, i % 2) for i, section in enumerate(self.sections)
+        )
         total = 0
-        for a, b in self.pairs:
-            if not a.isdisjoint(b):
-                total += 1
+        n_open = 0
+        for _, is_end in events:
+            if is_end:
+                n_open -= 1
+            else:
+                total += n_open
+                n_open += 1
         return total
 
 
@@ -45,6 +62,7 @@ if __name__ == "__main__":
     test_cleaner = CampCleaner(test_content)
     assert test_cleaner.solve_part1() == 2
     assert test_cleaner.solve_part2() == 4
+    assert test_cleaner.count_overlaps() == 49
 
     file = Path(__file__).parent / "input.txt"
     content = file.read_text()
@@ -1,6 +1,11 @@
 """Day 5: Supply Stacks"""
 
+import io
+from array import array
+from collections.abc import Iterable, Iterator
+from itertools import chain, takewhile
 from pathlib import Path
+from typing import TextIO
 
 test_content = """
     [D]    
@@ -15,48 +20,71 @@ move 1 from 1 to 2
 """  # noqa: W291
 
 
+Action = tuple[int, int, int]
+
+
+def parse_actions(lines: Iterable[str]) -> Iterator[Action]:
+    """Parse 'move N from A to B' lines into (N, A - 1, B - 1), i.e. the
+    number of crates and the indexes of the stacks."""
+    for line in lines:
+        if line.strip():
+            _, n, _, a, _, b = line.split()
+            yield int(n), int(a) - 1, int(b) - 1
+
+
 class CargoCrane:
-    stacks: dict[str, str]
+    stacks: list[bytearray]
 
-    def __init__(self, content: str):
-        stack_rows, actions = content.strip("\n").split("\n\n")
+    def __init__(self, content: str | TextIO):
+        # Read from a file handle (or any iterable of lines) without loading
+        # it completely into memory
+        if isinstance(content, str):
+            content = io.StringIO(content.strip("\n"))
+        lines = iter(content)
+        stack_rows = list(takewhile(lambda line: line.strip(), lines))
         self.initial_states = self._get_initial_states(stack_rows)
-        self.actions = actions.split("\n")
+        # Store all actions as packed triples of integers
+        self.actions = array("I", chain.from_iterable(parse_actions(lines)))
 
     @staticmethod
-    def _get_initial_states(stack_rows: str) -> dict[str, str]:
+    def _get_initial_states(stack_rows: list[str]) -> list[bytes]:
         # Reverse the input
-        stack_rows = stack_rows.split("\n")
-        stack_rows.reverse()
+        stack_rows = [row.rstrip("\n") for row in reversed(stack_rows)]
         # The contents of the crates (letters A-Z) in the different stacks are
-        # always separated by 4 characters
+        # always separated by 4 characters. The stacks are numbered from 1.
         s = slice(1, len(stack_rows[0]), 4)
-        # Create dictionary of stacks where each stack can be accessed by its
-        # number
-        stacks = {i: "" for i in stack_rows[0][s]}
+        stacks = [bytearray() for _ in stack_rows[0][s]]
         for row in stack_rows[1:]:
-            for i, item in zip(stacks.keys(), row[s], strict=False):
-                stacks[i] += item.strip()  # remove whitespace before appending
-        return stacks
+            for stack, item in zip(stacks, row[s], strict=False):
+                if item != " ":
+                    stack.append(ord(item))
+        return [bytes(stack) for stack in stacks]
 
-    def apply_actions(self, one_by_one: bool = True) -> None:
-        """Move crates between stacks according to the actions in the input."""
+    def apply_actions(
+        self, one_by_one: bool = True, actions: Iterable[Action] | None = None
+    ) -> None:
+        """Move crates between stacks according to the actions in the input
+        (or the given actions, e.g. streamed from a file with
+        parse_actions)."""
         # Reset stacks to their initial states
-        self.stacks = self.initial_states.copy()
+        self.stacks = [bytearray(stack) for stack in self.initial_states]
+        if actions is None:
+            actions = zip(*[iter(self.actions)] * 3, strict=True)
 
-        for action in self.actions:
-            _, n, _, a, _, b = action.split(" ")
-            n = int(n)
+        for n, a, b in actions:
             # Remove top-n elements from stack A
-            self.stacks[a], top = self.stacks[a][:-n], self.stacks[a][-n:]
+            source = self.stacks[a]
+            top = source[-n:]
+            del source[-n:]
             # Add new crates on top of stack B (reverse order of top crates if
             # one_by_one is True, i.e. if crane can only move one crate at a
             # time)
-            self.stacks[b] += top[::-1] if one_by_one else top
+            if one_by_one:
+                top.reverse()
+            self.stacks[b] += top
 
     def get_top_elements(self) -> str:
-        top_elements = [stack[-1] for stack in self.stacks.values()]
-        return "".join(top_elements)
+        return bytes(stack[-1] for stack in self.stacks).decode()
 
     def solve_part1(self) -> str:
         self.apply_actions(one_by_one=True)
@@ -73,7 +101,7 @@ if __name__ == "__main__":
     assert test_crane.solve_part2() == "MCD"
 
     file = Path(__file__).parent / "input.txt"
-    content = file.read_text()
-    crane = CargoCrane(content)
+    with file.open() as f:
+        crane = CargoCrane(f)
     print(f"Part 1: {crane.solve_part1()}")
     print(f"Part 2: {crane.solve_part2()}")
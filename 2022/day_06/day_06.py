@@ -1,18 +1,65 @@
 """Day 6: Tuning Trouble"""
 
+import mmap
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 
+CHUNK_SIZE = 1 << 20
+
+
+def find_markers(
+    chunks: Iterable[bytes], sizes: Iterable[int]
+) -> dict[int, int]:
+    """Find the first marker (sequence of distinct characters) of each size
+    in a single pass over the datastream, which may be split into chunks.
+
+    Return the number of characters processed until the end of each marker.
+    """
+    remaining = sorted(set(sizes))
+    markers = {}
+    # Position of the last occurrence of each character
+    last_seen = [-1] * 256
+    # Start of the longest window of distinct characters ending at the
+    # current position
+    start = 0
+    offset = 0
+
+    for chunk in chunks:
+        for i, char in enumerate(chunk, start=offset):
+            if last_seen[char] >= start:
+                start = last_seen[char] + 1
+            last_seen[char] = i
+            # Sizes are sorted, so only the smallest one has to be checked
+            while remaining and i - start + 1 >= remaining[0]:
+                markers[remaining.pop(0)] = i + 1
+            if not remaining:
+                return markers
+        offset += len(chunk)
+
+    return markers
+
+
+def read_chunks(file: Path, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """Read a (possibly huge) file in chunks via a memory map."""
+    with (
+        file.open("rb") as f,
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+    ):
+        for pos in range(0, len(mm), chunk_size):
+            yield mm[pos : pos + chunk_size]
+
 
 class SignalTuner:
     def __init__(self, content: str):
-        self.datastream = content.strip()
+        self.datastream = content.strip().encode()
 
     def find_marker(self, n_characters: int = 4) -> tuple[int, str]:
         """Find first unique sequence of length n_characters in datastream."""
-        for idx in range(n_characters, len(self.datastream)):
-            marker = self.datastream[idx - n_characters : idx]
-            if len(set(marker)) == n_characters:
-                return idx, marker
+        markers = find_markers([self.datastream], [n_characters])
+        if n_characters not in markers:
+            raise ValueError(f"No marker of length {n_characters} found.")
+        idx = markers[n_characters]
+        return idx, self.datastream[idx - n_characters : idx].decode()
 
     def solve_part1(self) -> int:
         idx, _ = self.find_marker()
@@ -40,7 +87,14 @@ if __name__ == "__main__":
     assert SignalTuner("nznrnfrfntjfmvfwmzdfjlvtqnbhcprsg").solve_part2() == 29
     assert SignalTuner("zcfzfwzzqfrljwzlrfnpqdbhtmscgvjw").solve_part2() == 26
 
+    chunks = [b"nznrnfrfnt", b"jfmvfwmzdf", b"jlvtqnbhcprsg"]
+    assert find_markers(chunks, [4, 14]) == {4: 10, 14: 29}
+
     file = Path(__file__).parent / "input.txt"
+    # Reading the file in chunks must not change the result
+    assert find_markers(read_chunks(file, 64), [4, 14]) == find_markers(
+        [file.read_bytes().strip()], [4, 14]
+    )
     content = file.read_text()
     tuner = SignalTuner(content)
     print(f"Part 1: {tuner.solve_part1()}")
@@ -1,6 +1,11 @@
 """Day 7: No Space Left On Device"""
 
+import io
+import sys
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import TextIO
 
 test_content = """
 $ cd /
@@ -29,55 +34,117 @@ $ ls
 """
 
 
-class FileNavigator:
-    def __init__(self, content: str):
-        self.terminal_history = content.strip().split("\n")
-        self.dirs = self._get_dirs_and_sizes()
-
-    def _get_dirs_and_sizes(self) -> dict[tuple[str, ...], int]:
-        dirs = {}
-        current_dir = ()
-
-        for element in self.terminal_history:
-            parts = element.split(" ")
-            if element.startswith("$ cd"):
-                if parts[2] == "..":
-                    # Go up one level
-                    current_dir = current_dir[:-1]
-                else:
-                    # Go down one level
-                    current_dir += (parts[2],)
-                # Initialize size of current dir (if it was not set already)
-                dirs.setdefault(current_dir, 0)
-            elif element.startswith(("$ ls", "dir")):
-                continue
+@dataclass(eq=False, slots=True)
+class Directory:
+    name: str
+    parent: "Directory | None" = None
+    children: dict[str, "Directory"] = field(default_factory=dict)
+    # Total size of all files in the directory and its subdirectories
+    size: int = 0
+    # Part of size that was already added to the parent directory
+    _propagated: int = field(default=0, repr=False)
+
+    def subdir(self, name: str) -> "Directory":
+        """Return the subdirectory with the given name (create it if it does
+        not exist yet)."""
+        if (child := self.children.get(name)) is None:
+            # Names are interned, as they repeat a lot in large file systems
+            name = sys.intern(name)
+            child = self.children[name] = Directory(name, parent=self)
+        return child
+
+    def propagate(self) -> None:
+        """Add the size gathered since the last call to the parent."""
+        if self.parent is not None:
+            self.parent.size += self.size - self._propagated
+            self._propagated = self.size
+
+    def walk(self) -> Iterator["Directory"]:
+        """Iterate over this directory and all its subdirectories."""
+        stack = [self]
+        while stack:
+            directory = stack.pop()
+            yield directory
+            stack.extend(directory.children.values())
+
+    def find(self, path: str) -> "Directory":
+        """Get a subdirectory by its path relative to this directory."""
+        directory = self
+        for name in path.strip("/").split("/"):
+            if name:
+                directory = directory.children[name]
+        return directory
+
+
+def parse_history(lines: Iterable[str]) -> Directory:
+    """Build the directory tree from the terminal history line by line.
+
+    Only the directories on the current path are kept on a stack. The size of
+    a directory is added to its parent when leaving it, so every file size is
+    only added once.
+    """
+    root = Directory("/")
+    stack = [root]
+
+    for line in lines:
+        if line.startswith("$ cd "):
+            name = line[5:].rstrip("\n")
+            if name == "/":
+                while len(stack) > 1:
+                    stack.pop().propagate()
+            elif name == "..":
+                stack.pop().propagate()
             else:
-                # Element must be a file. Add file size to the current dir and
-                # all dirs containing it.
-                file_size = int(parts[0])
-                for i in range(1, len(current_dir) + 1):
-                    dirs[current_dir[:i]] += file_size
+                stack.append(stack[-1].subdir(name))
+        elif line[:1].isdigit():
+            # Line is a file (ignore "$ ls" and "dir" lines)
+            stack[-1].size += int(line.split(" ", 1)[0])
+
+    # Go back to the root
+    while len(stack) > 1:
+        stack.pop().propagate()
 
-        return dirs
+    return root
+
+
+class FileNavigator:
+    def __init__(self, content: str | TextIO):
+        # Read the history from a file handle (or any iterable of lines)
+        # without loading it completely into memory
+        lines = (
+            io.StringIO(content.strip())
+            if isinstance(content, str)
+            else content
+        )
+        self.root = parse_history(lines)
 
     def solve_part1(self) -> int:
-        return sum(size for size in self.dirs.values() if size <= 100_000)
+        return sum(
+            directory.size
+            for directory in self.root.walk()
+            if directory.size <= 100_000
+        )
 
     def solve_part2(self) -> int:
         total_space = 70_000_000
         required_space = 30_000_000
-        unused_space = total_space - self.dirs[("/",)]
+        unused_space = total_space - self.root.size
         min_size = required_space - unused_space
-        return min(size for size in self.dirs.values() if size >= min_size)
+        return min(
+            directory.size
+            for directory in self.root.walk()
+            if directory.size >= min_size
+        )
 
 
 if __name__ == "__main__":
     test_navigator = FileNavigator(test_content)
     assert test_navigator.solve_part1() == 95_437
     assert test_navigator.solve_part2() == 24_933_642
+    assert test_navigator.root.find("/a").size == 94_853
 
     file = Path(__file__).parent / "input.txt"
-    content = file.read_text()
-    navigator = FileNavigator(content)
+    with file.open() as f:
+        navigator = FileNavigator(f)
     print(f"Part 1: {navigator.solve_part1()}")
     print(f"Part 2: {navigator.solve_part2()}")
@@ -1,8 +1,11 @@
 """Day 8: Treetop Tree House"""
 
 from collections.abc import Iterator
+from functools import cached_property
 from pathlib import Path
 
+from aoc.grid import Grid
+
 test_content = """
 30373
 25512
@@ -14,60 +17,60 @@ test_content = """
 
 class TreeFinder:
     def __init__(self, content: str):
-        self.array = [[*line] for line in content.strip().split("\n")]
-        self.n_rows = len(self.array[0])
-        self.n_cols = len(self.array)
-
-    def interior(self) -> Iterator[tuple[str, int, int]]:
-        """Iterate over the interior of the array."""
-        for i in range(1, self.n_rows - 1):
-            for j in range(1, self.n_cols - 1):
-                yield self.array[i][j], i, j
-
-    def get_neighbors_list(self, i: int, j: int) -> list[list[str]]:
-        """Get lists of neighbors in each direction (ordered by distance)."""
-        neighbors = [
-            self.array[i][:j][::-1],  # left (reversed order)
-            self.array[i][j + 1 :],  # right
-            [x[j] for x in self.array[:i]][::-1],  # top (reversed order)
-            [x[j] for x in self.array[i + 1 :]],  # bottom
-        ]
-        return neighbors
+        self.grid = Grid.from_text(content)
+
+    def lines_of_sight(self) -> Iterator[range]:
+        """Iterate over the cell indices of all rows and columns in both
+        directions."""
+        grid = self.grid
+        for y in range(grid.height):
+            row = range(grid.index(0, y), grid.index(0, y + 1))
+            yield row
+            yield row[::-1]
+        for x in range(grid.width):
+            column = range(x, len(grid), grid.width)
+            yield column
+            yield column[::-1]
+
+    @cached_property
+    def views(self) -> tuple[bytearray, list[int]]:
+        """Determine which trees are visible from outside the grid and the
+        scenic score of each tree.
+
+        Every row and column is scanned once in each direction, so this takes
+        O(n) time for n trees in total.
+        """
+        cells = self.grid.cells
+        visible = bytearray(len(cells))
+        scores = [1] * len(cells)
+
+        for line in self.lines_of_sight():
+            tallest = -1
+            # Positions and heights of the trees that can still block the
+            # view of following trees (with decreasing heights)
+            stack = []
+            for k, i in enumerate(line):
+                height = cells[i]
+                if height > tallest:
+                    visible[i] = 1
+                    tallest = height
+                # Trees lower than the current one cannot block any view
+                # anymore
+                while stack and stack[-1][1] < height:
+                    stack.pop()
+                # Viewing distance towards the start of the line
+                scores[i] *= k - stack[-1][0] if stack else k
+                stack.append((k, height))
+
+        return visible, scores
 
     def solve_part1(self) -> int:
-        # Count trees around the edge of the grid
-        visible = 2 * (self.n_rows + self.n_cols - 2)
-
-        for x, i, j in self.interior():
-            neighbors_list = self.get_neighbors_list(i, j)
-            # Check if tree is visible from any of the directions
-            if any(max(neighbors) < x for neighbors in neighbors_list):
-                visible += 1
-
-        return visible
+        visible, _ = self.views
+        return sum(visible)
 
     def solve_part2(self) -> int:
-        max_score = 0
-
-        for x, i, j in self.interior():
-            neighbors_list = self.get_neighbors_list(i, j)
-            score = 1
-
-            # Iterate over all directions
-            for neighbors in neighbors_list:
-                # Compute viewing distance
-                n_trees = 0
-                for tree in neighbors:
-                    n_trees += 1
-                    if tree >= x:
-                        break
-                # Update score
-                score *= n_trees
-
-            if score > max_score:
-                max_score = score
-
-        return max_score
+        _, scores = self.views
+        return max(scores)
 
 
 if __name__ == "__main__":
@@ -1,8 +1,7 @@
 """Day 9: Rope Bridge"""
 
-from collections.abc import Iterator
+from array import array
 from pathlib import Path
-from typing import Self
 
 test_content = """
 R 4
@@ -27,73 +26,66 @@ U 20
 """
 
 
-class Point:
-    def __init__(self, x: int, y: int):
-        self.x = x
-        self.y = y
-
-    def add(self, x: int, y: int) -> Self:
-        self.x += x
-        self.y += y
-        return self
-
-    def move(self, direction: str) -> Self:
-        directions = {"U": (0, 1), "D": (0, -1), "L": (-1, 0), "R": (1, 0)}
-        return self.add(*directions[direction])
-
-    def follow(self, other: "Point") -> Self:
-        # Get distance (in x and y) to other point
-        dx = other.x - self.x
-        dy = other.y - self.y
-        # Tail needs to move if distance in at least one component is > 1
-        if abs(dx) > 1 or abs(dy) > 1:
-            # Move one step in direction of the other object if distance in
-            # component is positive. Diagonal steps are handled automatically.
-            x = bool(dx) * (-1 if dx < 0 else 1)
-            y = bool(dy) * (-1 if dy < 0 else 1)
-            self.add(x, y)
-        return self
-
-    @property
-    def coordinates(self) -> tuple[int, int]:
-        return self.x, self.y
+DIRECTIONS = {"U": (0, 1), "D": (0, -1), "L": (-1, 0), "R": (1, 0)}
 
 
 class RopeSimulator:
     def __init__(self, content: str):
-        self.actions = content.strip().split("\n")
-
-    def iter_head_motions(self) -> Iterator[str]:
-        for action in self.actions:
+        self.motions = []
+        for action in content.strip().split("\n"):
             direction, size = action.split()
-            for _ in range(int(size)):
-                yield direction
-
-    def solve_part1(self) -> int:
-        head = Point(0, 0)
-        tail = Point(0, 0)
-        visited = set()
+            self.motions.append((DIRECTIONS[direction], int(size)))
+
+    def head_limits(self) -> tuple[int, int, int, int]:
+        """Return xmin, xmax, ymin, ymax of all positions of the head. The
+        other knots always stay within these limits."""
+        x = y = xmin = xmax = ymin = ymax = 0
+        for (dx, dy), size in self.motions:
+            x += dx * size
+            y += dy * size
+            xmin, xmax = min(xmin, x), max(xmax, x)
+            ymin, ymax = min(ymin, y), max(ymax, y)
+        return xmin, xmax, ymin, ymax
+
+    def simulate(self, n_knots: int) -> int:
+        """Move the rope and count the positions visited by its tail."""
+        xmin, xmax, ymin, ymax = self.head_limits()
+        width = xmax - xmin + 1
+        # Positions visited by the tail are stored as bits
+        visited = bytearray((width * (ymax - ymin + 1) + 7) // 8)
+        # x and y coordinates of all knots
+        knots = array("l", [0]) * (2 * n_knots)
+        tail = 2 * (n_knots - 1)
+
+        bit = -ymin * width - xmin
+        visited[bit >> 3] |= 1 << (bit & 7)
+
+        for (dx, dy), size in self.motions:
+            for _ in range(size):
+                knots[0] += dx
+                knots[1] += dy
+                for i in range(2, 2 * n_knots, 2):
+                    dx_ = knots[i - 2] - knots[i]
+                    dy_ = knots[i - 1] - knots[i + 1]
+                    if -1 <= dx_ <= 1 and -1 <= dy_ <= 1:
+                        # Knot does not move, so neither do the ones after it
+                        break
+                    # Move one step towards the previous knot. Diagonal steps
+                    # are handled automatically.
+                    knots[i] += (dx_ > 0) - (dx_ < 0)
+                    knots[i + 1] += (dy_ > 0) - (dy_ < 0)
+                else:
+                    # Tail has moved
+                    bit = (knots[tail + 1] - ymin) * width + knots[tail] - xmin
+                    visited[bit >> 3] |= 1 << (bit & 7)
 
-        for direction in self.iter_head_motions():
-            head.move(direction)
-            tail.follow(head)
-            visited.add(tail.coordinates)
+        return int.from_bytes(visited, "big").bit_count()
 
-        return len(visited)
+    def solve_part1(self) -> int:
+        return self.simulate(n_knots=2)
 
     def solve_part2(self) -> int:
-        points = [Point(0, 0) for _ in range(10)]
-        visited = set()
-
-        for direction in self.iter_head_motions():
-            for i, point in enumerate(points):
-                if i == 0:
-                    point.move(direction)
-                else:
-                    point.follow(points[i - 1])
-            visited.add(points[-1].coordinates)
-
-        return len(visited)
+        return self.simulate(n_knots=10)
 
 
 if __name__ == "__main__":
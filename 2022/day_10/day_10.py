@@ -1,5 +1,7 @@
 """Day 10: Cathode-Ray Tube"""
 
+from array import array
+from collections.abc import Iterable
 from pathlib import Path
 
 test_image = """
@@ -12,30 +14,46 @@ test_image = """
 """
 
 
+LIT, DARK = b"#."
+
+
+def run_program(instructions: Iterable[str]) -> array:
+    """Execute noop and addx instructions and return the value of the X
+    register during each cycle (plus its final value)."""
+    x = 1  # initial value of X
+    x_values = array("l", [x])
+    for instruction in instructions:
+        if instruction.startswith("addx"):
+            # addx takes two cycles and changes X after the second one
+            x_values.append(x)
+            x += int(instruction[5:])
+        x_values.append(x)
+    return x_values
+
+
+def render(x_values: array, width: int, height: int) -> str:
+    """Draw a pixel in each cycle, which is lit if the sprite (three pixels
+    wide and centered at X) overlaps the current column."""
+    rows = []
+    for y in range(height):
+        row = x_values[y * width : (y + 1) * width]
+        rows.append(
+            bytes(
+                LIT if -1 <= x - col <= 1 else DARK
+                for col, x in enumerate(row)
+            )
+        )
+    return b"\n".join(rows).decode() + "\n"
+
+
 class CathodeRayTube:
-    def __init__(self, content: str):
+    def __init__(self, content: str, screen_size: tuple[int, int] = (40, 6)):
         self.instructions = content.strip().split("\n")
-        self.x_values = [1]  # initial value for X
-        self._run_instructions()
-        self._screen_size = (40, 6)
-
-    def _run_instructions(self) -> None:
-        """Run all instructions and collect X values for each cycle."""
-        for instruction in self.instructions:
-            x_old = self.x_values[-1]
-            self.x_values.append(x_old)
-            if instruction.startswith("addx"):
-                _, val = instruction.split()
-                self.x_values.append(x_old + int(val))
+        self.x_values = run_program(self.instructions)
+        self.screen_size = screen_size
 
     def render_image(self) -> str:
-        image = ""
-        width, height = self._screen_size
-        for cycle, x in enumerate(self.x_values[: width * height]):
-            image += "#" if cycle % width in (x - 1, x, x + 1) else "."
-            if (cycle + 1) % width == 0:
-                image += "\n"
-        return image
+        return render(self.x_values, *self.screen_size)
 
     def solve_part1(self) -> int:
         cycles = range(20, 221, 40)
@@ -54,6 +72,10 @@ if __name__ == "__main__":
     test_crt = CathodeRayTube(test_content)
     assert test_crt.solve_part1() == 13140
     assert test_crt.solve_part2().strip() == test_image.strip()
+    small_crt = CathodeRayTube(test_content, screen_size=(20, 2))
+    small_image = small_crt.render_image().split()
+    assert [len(row) for row in small_image] == [20, 20]
+    assert small_image[0] == test_image.split()[0][:20]
 
     file = Path(__file__).parent / "input.txt"
     content = file.read_text()
@@ -6,6 +6,8 @@ from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
 
+from aoc.parse import compile_expression, ints
+
 
 @dataclass
 class Monkey:
@@ -14,7 +16,6 @@ class Monkey:
     mod: int
     true: int
     false: int
-    counter: int = 0
 
 
 class MonkeyInTheMiddle:
@@ -31,11 +32,8 @@ class MonkeyInTheMiddle:
             false = re.search("If false: throw to monkey (\\d+)$", x).group(1)
 
             monkey = Monkey(
-                # Append a comma to items to make sure that items is always a
-                # tuple after running eval()
-                items=list(eval(items + ",")),
-                # Convert operation to lambda
-                operation=eval(f"lambda old: {operation}"),
+                items=ints(items),
+                operation=compile_expression(operation, variable="old"),
                 mod=int(mod),
                 true=int(true),
                 false=int(false),
@@ -44,21 +42,70 @@ class MonkeyInTheMiddle:
 
         return monkeys
 
+    @staticmethod
+    def follow_item(
+        monkeys: list[Monkey],
+        monkey: int,
+        item: int,
+        n_rounds: int,
+        relief_factor: int,
+        mod: int,
+    ) -> list[int]:
+        """Follow a single item through all rounds and count how often each
+        monkey inspects it.
+
+        Items do not influence each other, and the state of an item at the
+        start of a round (its monkey and its worry level modulo mod) fully
+        determines its future. As soon as a state repeats, the remaining
+        rounds are covered by skipping whole cycles.
+        """
+        counts = [0] * len(monkeys)
+        # First round of each state and the counts at the start of each round
+        history = {}
+        snapshots = []
+
+        for round_ in range(n_rounds):
+            state = (monkey, item)
+            if state in history:
+                start = history[state]
+                n_cycles, rest = divmod(n_rounds - round_, round_ - start)
+                return [
+                    count
+                    + n_cycles * (count - snapshots[start][i])
+                    + snapshots[start + rest][i]
+                    - snapshots[start][i]
+                    for i, count in enumerate(counts)
+                ]
+            history[state] = round_
+            snapshots.append(counts.copy())
+
+            # Monkeys take turns in ascending order, so an item thrown to a
+            # monkey with a higher number is inspected again in this round
+            while True:
+                current = monkeys[monkey]
+                counts[monkey] += 1
+                item = (current.operation(item) // relief_factor) % mod
+                target = current.false if item % current.mod else current.true
+                if target <= monkey:
+                    monkey = target
+                    break
+                monkey = target
+
+        return counts
+
     def play(self, n_rounds: int, relief_factor: int) -> int:
         monkeys = self.parse_input()
         mod_lcm = math.lcm(*(monkey.mod for monkey in monkeys))
-
-        for _ in range(n_rounds):
-            for monkey in monkeys:
-                for item in monkey.items:
-                    item = (monkey.operation(item) // relief_factor) % mod_lcm
-                    i = monkey.true if item % monkey.mod == 0 else monkey.false
-                    monkeys[i].items.append(item)
-                    monkey.counter += 1
-                monkey.items = []
-
-        counts = sorted(monkey.counter for monkey in monkeys)
-        return counts[-1] * counts[-2]
+        totals = [0] * len(monkeys)
+        for i, monkey in enumerate(monkeys):
+            for item in monkey.items:
+                counts = self.follow_item(
+                    monkeys, i, item, n_rounds, relief_factor, mod_lcm
+                )
+                totals = [a + b for a, b in zip(totals, counts, strict=True)]
+
+        totals.sort()
+        return totals[-1] * totals[-2]
 
     def solve_part1(self) -> int:
         return self.play(n_rounds=20, relief_factor=3)
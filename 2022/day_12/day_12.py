@@ -1,10 +1,11 @@
 """Day 12: Hill Climbing Algorithm"""
 
-import math
-import string
+from array import array
 from collections import deque
+from functools import cached_property
 from pathlib import Path
-from typing import NamedTuple
+
+from aoc.grid import Grid
 
 test_content = """
 Sabqponm
@@ -15,90 +16,71 @@ abdefghi
 """
 
 
-class GridPoint(NamedTuple):
-    i: int
-    j: int
-    val: str
-
-    def diff(self, other: "GridPoint") -> int:
-        letters = string.ascii_lowercase
-        return letters.index(other.val) - letters.index(self.val)
-
-
-class Grid:
-    grid: list[list[GridPoint]]
-    start_point: GridPoint
-    end_point: GridPoint
+class HillClimber:
+    start_point: int
+    end_point: int
 
     def __init__(self, content: str):
-        self._initialize_grid(content)
-        self.n_rows = len(self.grid)
-        self.n_cols = len(self.grid[0])
-
-    def _initialize_grid(self, content: str) -> None:
-        content = content.strip().split("\n")
-        self.grid = []
-        for i, row in enumerate(content):
-            self.grid.append([])
-            for j, val in enumerate(row):
-                x = GridPoint(i, j, val.replace("S", "a").replace("E", "z"))
-                if val == "S":
-                    self.start_point = x
-                if val == "E":
-                    self.end_point = x
-                self.grid[i].append(x)
-
-    def neighbors(self, x: GridPoint) -> set[GridPoint]:
-        neighbors = {
-            self.grid[x.i][max(x.j - 1, 0)],  # west
-            self.grid[x.i][min(x.j + 1, self.n_cols - 1)],  # east
-            self.grid[max(x.i - 1, 0)][x.j],  # north
-            self.grid[min(x.i + 1, self.n_rows - 1)][x.j],  # south
-        }
-        neighbors.discard(x)
-        return neighbors
-
-    def climb(self) -> int:
+        self.grid = Grid.from_text(content)
+        self.start_point = self.grid.find("S")
+        self.end_point = self.grid.find("E")
+        self.grid[self.start_point] = ord("a")
+        self.grid[self.end_point] = ord("z")
+
+    @cached_property
+    def distances(self) -> array:
+        """Compute the smallest number of steps from every cell to the end
+        point (-1 if the end cannot be reached) with a single breadth-first
+        search backwards from the end."""
+        grid = self.grid
+        distances = array("l", [-1]) * len(grid)
+        distances[self.end_point] = 0
         queue = deque()
-        queue.append((self.start_point, 0))
-        # Store visited points and the smallest number of steps to reach them
-        visited = {self.start_point: 0, self.end_point: math.inf}
+        queue.append(self.end_point)
 
         while queue:
-            x, n = queue.popleft()
-            n += 1
-            for neighbor in self.neighbors(x):
-                if x.diff(neighbor) <= 1:
-                    if neighbor not in visited.keys():
-                        queue.append((neighbor, n))
-
-                    visited.setdefault(neighbor, n)
-                    if n < visited[neighbor]:
-                        visited[neighbor] = n
-
-        return visited[self.end_point]
+            i = queue.popleft()
+            n = distances[i] + 1
+            for j in grid.neighbors(i):
+                # Going backwards, we can descend at most one level
+                if distances[j] == -1 and grid[i] - grid[j] <= 1:
+                    distances[j] = n
+                    queue.append(j)
+
+        return distances
+
+    def steps_from(self, x: int, y: int) -> int:
+        """Return the smallest number of steps from (x, y) to the end."""
+        n = self.distances[self.grid.index(x, y)]
+        if n == -1:
+            raise ValueError(f"End cannot be reached from {(x, y)}.")
+        return n
 
     def solve_part1(self) -> int:
-        return self.climb()
+        return self.steps_from(*self.grid.coordinates(self.start_point))
 
     def solve_part2(self) -> int:
-        min_steps = math.inf
-        for row in self.grid:
-            for x in row:
-                if x.val == "a":
-                    self.start_point = x
-                    if (n := self.climb()) < min_steps:
-                        min_steps = n
-        return min_steps
+        distances = self.distances
+        steps = min(
+            (
+                distances[i]
+                for i in self.grid.find_all("a")
+                if distances[i] != -1
+            ),
+            default=None,
+        )
+        if steps is None:
+            raise ValueError("End cannot be reached from any lowest point.")
+        return steps
 
 
 if __name__ == "__main__":
-    test_puzzle = Grid(test_content)
+    test_puzzle = HillClimber(test_content)
     assert test_puzzle.solve_part1() == 31
     assert test_puzzle.solve_part2() == 29
 
     file = Path(__file__).parent / "input.txt"
     content = file.read_text()
-    puzzle = Grid(content)
+    puzzle = HillClimber(content)
     print(f"Part 1: {puzzle.solve_part1()}")
     print(f"Part 2: {puzzle.solve_part2()}")
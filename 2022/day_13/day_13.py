@@ -1,8 +1,11 @@
 """Day 13: Distress Signal"""
 
+from functools import cmp_to_key
 from math import prod
 from pathlib import Path
 
+from aoc.parse import nested_list
+
 test_content = """
 [1,1,3,1,1]
 [1,1,5,1,1]
@@ -30,71 +33,67 @@ test_content = """
 """
 
 
+Packet = list["Packet"] | int
+
+
+def compare(left: Packet, right: Packet) -> int:
+    """Return a negative number if left is smaller than right (i.e. the
+    packets are in the right order), zero if they are equal and a positive
+    number otherwise."""
+    if isinstance(left, int) and isinstance(right, int):
+        return left - right
+    if isinstance(left, int):
+        left = [left]
+    if isinstance(right, int):
+        right = [right]
+    for a, b in zip(left, right, strict=False):
+        if (result := compare(a, b)) != 0:
+            return result
+    return len(left) - len(right)
+
+
+DIVIDERS = ([[2]], [[6]])
+
+
 class Puzzle:
     def __init__(self, content: str):
         pairs = [pair.split("\n") for pair in content.strip().split("\n\n")]
-        self.pairs = [[eval(x) for x in pair] for pair in pairs]
-
-    def compare(self, left_: list, right_: list) -> bool | None:
-        # print(f"Compare {left_} vs {right_}")
-        iter_left = iter(left_)
-        iter_right = iter(right_)
-
-        while True:
-            left = next(iter_left, None)
-            right = next(iter_right, None)
-
-            if left is None and right is None:
-                # No items left in both sides.
-                # Can only happen when called in a recursion.
-                return None
-            else:
-                if left is None:
-                    return True  # left side is smaller
-                elif right is None:
-                    return False  # right side is smaller
-
-            if isinstance(left, int) and isinstance(right, int):
-                if left < right:
-                    return True  # right order
-                elif left > right:
-                    return False  # not right order
-            else:
-                if not isinstance(left, list):
-                    left = [left]
-                if not isinstance(right, list):
-                    right = [right]
-
-                if (right_order_ := self.compare(left, right)) is not None:
-                    return right_order_
+        self.pairs = [[nested_list(x) for x in pair] for pair in pairs]
+
+    @property
+    def packets(self) -> list[Packet]:
+        return [packet for pair in self.pairs for packet in pair]
+
+    def sorted_packets(self) -> list[Packet]:
+        """Sort all packets (including the dividers) in O(n log n)."""
+        packets = [*DIVIDERS, *self.packets]
+        return sorted(packets, key=cmp_to_key(compare))
 
     def solve_part1(self) -> int:
         indexes = [
-            i + 1 for i, pair in enumerate(self.pairs) if self.compare(*pair)
+            i + 1
+            for i, (left, right) in enumerate(self.pairs)
+            if compare(left, right) < 0
         ]
         return sum(indexes)
 
     def solve_part2(self) -> int:
-        dividers = ([[2]], [[6]])
-        # Get list of packets and dividers
-        packets = list(dividers)
-        for pair in self.pairs:
-            packets += list(pair)
-        # Sort packets
-        n = len(packets)
-        for i in range(n):
-            for j in range(n - i - 1):
-                # Swap elements if right element is 'smaller'
-                if self.compare(packets[j + 1], packets[j]):
-                    packets[j], packets[j + 1] = packets[j + 1], packets[j]
-
-        return prod(packets.index(divider) + 1 for divider in dividers)
+        # Sorting is not needed: The index of each divider is determined by
+        # the number of packets (and dividers) that are smaller than it.
+        packets = self.packets
+        indexes = []
+        for i, divider in enumerate(DIVIDERS):
+            n_smaller = sum(compare(packet, divider) < 0 for packet in packets)
+            indexes.append(n_smaller + i + 1)
+        return prod(indexes)
 
 
 if __name__ == "__main__":
     test_puzzle = Puzzle(test_content)
     assert test_puzzle.solve_part1() == 13
     assert test_puzzle.solve_part2() == 140
+    sorted_packets = test_puzzle.sorted_packets()
+    assert prod(sorted_packets.index(d) + 1 for d in DIVIDERS) == 140
 
     file = Path(__file__).parent / "input.txt"
     content = file.read_text()
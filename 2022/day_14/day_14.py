@@ -1,8 +1,9 @@
 """Day 14: Regolith Reservoir"""
 
-from collections.abc import Callable
+from itertools import pairwise
 from pathlib import Path
-from typing import NamedTuple
+
+from aoc.grid import Grid
 
 test_content = """
 498,4 -> 498,6 -> 496,6
@@ -10,103 +11,138 @@ test_content = """
 """
 
 
-class GridPoint(NamedTuple):
-    x: int
-    y: int
+ORIGIN = (500, 0)
+AIR, ROCK, SAND = b".#o"
+# Translate the cells of a row into a binary number of its rocks
+ROCK_BITS = bytes.maketrans(b".#o+", b"0100")
 
 
 class ReservoirSimulator:
-    origin: GridPoint
-    blocked: dict[GridPoint, str]
-
-    def __init__(self, content: str):
-        self.content = content.strip().split("\n")
-        self.origin = GridPoint(500, 0)
-
-    def initialize_grid(self) -> None:
-        self.blocked = {}
-        for row in self.content:
-            positions = [
-                [int(v) for v in pair.split(",")] for pair in row.split(" -> ")
+    grid: Grid
+    origin: int
+    abyss: int
+
+    def __init__(self, content: str, render: bool = False):
+        # Print the grid after each simulation
+        self.render = render
+        self.paths = [
+            [
+                tuple(int(v) for v in pair.split(","))
+                for pair in row.split(" -> ")
             ]
-            for (x1, y1), (x2, y2) in zip(
-                positions[:-1], positions[1:], strict=False
-            ):
+            for row in content.strip().split("\n")
+        ]
+        self.ymax = max(y for path in self.paths for _, y in path)
+
+    def initialize_grid(self, floor: bool) -> None:
+        # The floor is two rows below the lowest rock. Sand can spread at
+        # most one column per row to either side of the origin.
+        height = self.ymax + 3
+        x0, y0 = ORIGIN
+        xmin = min(x0 - height, *(x for path in self.paths for x, _ in path))
+        xmax = max(x0 + height, *(x for path in self.paths for x, _ in path))
+        self.grid = grid = Grid(xmax - xmin + 1, height)
+        self.origin = grid.index(x0 - xmin, y0)
+
+        for path in self.paths:
+            for (x1, y1), (x2, y2) in pairwise(path):
                 for x in range(min(x1, x2), max(x1, x2) + 1):
                     for y in range(min(y1, y2), max(y1, y2) + 1):
-                        self.blocked[GridPoint(x, y)] = "#"
-
-    def get_limits(self) -> tuple[int, int, int]:
-        xmin = min(p.x for p in self.blocked.keys())
-        xmax = max(p.x for p in self.blocked.keys())
-        ymax = max(p.y for p in self.blocked.keys())
-        return xmin, xmax, ymax
+                        grid[grid.index(x - xmin, y)] = ROCK
+        if floor:
+            grid.cells[grid.row(height - 1)] = bytes([ROCK]) * grid.width
+            self.abyss = len(grid)
+        else:
+            # Sand falling below the lowest rock never comes to rest
+            self.abyss = grid.index(0, self.ymax + 1)
 
     def __str__(self) -> str:
         """Convert the grid into a string."""
-        xmin, xmax, ymax = self.get_limits()
-        grid = f"Grid size: {xmax - xmin + 1} x {ymax + 1}\n"
-        for y in range(ymax + 1):
-            for x in range(xmin, xmax + 1):
-                grid += self.blocked.get(GridPoint(x, y), ".")
-            grid += "\n"
-        return grid
-
-    def simulate(
-        self,
-        is_blocked: Callable[[GridPoint], bool],
-        is_inside: Callable[[GridPoint], bool],
-    ) -> int:
+        grid = f"Grid size: {self.grid.width} x {self.grid.height}\n"
+        return grid + str(self.grid) + "\n"
+
+    def simulate(self) -> int:
+        """Drop sand from the origin until it either falls below the lowest
+        rock or the origin is blocked.
+
+        The path of the current grain is kept on a stack. The next grain
+        follows the same path, so it starts at the last position of the
+        previous grain before it came to rest.
+        """
+        cells = self.grid.cells
+        width = self.grid.width
+        path = [self.origin]
         counter = 0
-        point = self.origin
-
-        while point is not None and point not in self.blocked:
-            px, py = old_point = point
-            neighbors = [GridPoint(x, py + 1) for x in (px, px - 1, px + 1)]
 
-            for new_point in neighbors:
-                if is_blocked(new_point):
-                    continue
-                elif is_inside(new_point):
-                    point = new_point
+        while path:
+            i = path[-1]
+            if i >= self.abyss:
+                # All following grains would also fall into the abyss
+                break
+            for j in (i + width, i + width - 1, i + width + 1):
+                if cells[j] == AIR:
+                    path.append(j)
                     break
-                else:
-                    # Abyss reached
-                    point = None
-
-            if point == old_point:
-                self.blocked[point] = "o"
+            else:
+                # Grain came to rest
+                cells[i] = SAND
                 counter += 1
-                point = self.origin
+                path.pop()
+
+        if self.render:
+            cells[self.origin] = ord("+")
+            print(self)
 
-        self.blocked[self.origin] = "+"
-        print(self)
+        return counter
+
+    def fill_rows(self) -> int:
+        """Count the sand that comes to rest when there is a floor.
+
+        In that case, a cell is eventually filled with sand if and only if it
+        is not a rock and at least one of the three cells above it is filled.
+        The rows are processed as bitmasks from top to bottom.
+        """
+        grid = self.grid
+        width = grid.width
+        # Bit (width - 1 - x) of a mask represents column x
+        full = (1 << width) - 1
+        x0, y0 = grid.coordinates(self.origin)
+        sand = 1 << (width - 1 - x0)
+        counter = 0
+
+        for y in range(y0, grid.height - 1):
+            if y > y0:
+                rocks = int(grid.cells[grid.row(y)].translate(ROCK_BITS), 2)
+                sand = (sand | sand << 1 | sand >> 1) & full & ~rocks
+            counter += sand.bit_count()
+            if self.render:
+                bits = f"{sand:0{width}b}"
+                for x in range(width):
+                    if bits[x] == "1":
+                        grid[grid.index(x, y)] = SAND
+
+        if self.render:
+            grid[self.origin] = ord("+")
+            print(self)
 
         return counter
 
     def solve_part1(self) -> int:
-        self.initialize_grid()
-        xmin, xmax, ymax = self.get_limits()
-        return self.simulate(
-            is_blocked=lambda p: p in self.blocked,
-            is_inside=lambda p: xmin <= p.x <= xmax and p.y <= ymax,
-        )
+        self.initialize_grid(floor=False)
+        return self.simulate()
 
     def solve_part2(self) -> int:
-        self.initialize_grid()
-        ymax = self.get_limits()[2]
-        ymax += 2
-
-        return self.simulate(
-            is_blocked=lambda p: p in self.blocked or p.y == ymax,
-            is_inside=lambda p: p.y <= ymax,
-        )
+        self.initialize_grid(floor=True)
+        return self.fill_rows()
 
 
 if __name__ == "__main__":
     test_simulator = ReservoirSimulator(test_content)
     assert test_simulator.solve_part1() == 24
     assert test_simulator.solve_part2() == 93
+    # Check that simulating every grain gives the same result
+    test_simulator.initialize_grid(floor=True)
+    assert test_simulator.simulate() == 93
 
     file = Path(__file__).parent / "input.txt"
     content = file.read_text()
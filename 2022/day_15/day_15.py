@@ -1,7 +1,10 @@
 """Day 15: Beacon Exclusion Zone"""
 
+import multiprocessing
+import os
 import re
 from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import NamedTuple
 
@@ -30,16 +33,6 @@ class GridPoint(NamedTuple):
     def dist(self, other: "GridPoint") -> int:
         return abs(self.x - other.x) + abs(self.y - other.y)
 
-    def ball_slice(self, other: "GridPoint", y: int) -> Iterator["GridPoint"]:
-        radius = self.dist(other)
-        if min(self.y, other.y) - radius <= y <= max(self.y, other.y) + radius:
-            dy = abs(self.y - y)
-            for dx in range(radius + 1 - dy):
-                for sign in (-1, 1):
-                    point = GridPoint(self.x + sign * dx, y)
-                    if point not in (self, other):
-                        yield point
-
 
 class Limits(NamedTuple):
     xmin: int
@@ -48,9 +41,62 @@ class Limits(NamedTuple):
     ymax: int
 
 
+# Parameters of the actual puzzle input
+ROW = 2_000_000
+LIMITS = Limits(0, 4_000_000, 0, 4_000_000)
+
+
+def merge(intervals: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    """Merge overlapping or adjacent closed intervals."""
+    merged = []
+    for lo, hi in sorted(intervals):
+        if merged and lo <= merged[-1][1] + 1:
+            if hi > merged[-1][1]:
+                merged[-1] = (merged[-1][0], hi)
+        else:
+            merged.append((lo, hi))
+    return merged
+
+
+def covered_intervals(
+    ranges: list[tuple[int, int, int]], y: int
+) -> list[tuple[int, int]]:
+    """Return the merged intervals of x values in row y that are covered by
+    at least one sensor range (x, y, radius)."""
+    intervals = []
+    for sensor_x, sensor_y, radius in ranges:
+        dx = radius - abs(sensor_y - y)
+        if dx >= 0:
+            intervals.append((sensor_x - dx, sensor_x + dx))
+    return merge(intervals)
+
+
+def find_gap(
+    ranges: list[tuple[int, int, int]],
+    xmin: int,
+    xmax: int,
+    rows: range,
+) -> tuple[int, int] | None:
+    """Find the first uncovered point in the x limits by sweeping over rows.
+
+    Only plain data is passed and returned, so that this can be run in a
+    process pool.
+    """
+    for y in rows:
+        x = xmin
+        for lo, hi in covered_intervals(ranges, y):
+            if lo > x:
+                break
+            x = max(x, hi + 1)
+        if x <= xmax:
+            return x, y
+    return None
+
+
 class BeaconFinder:
     sensors: list[GridPoint]
     beacons: list[GridPoint]
+    radii: list[int]
 
     def __init__(self, content: str):
         self._process_input(content)
@@ -64,40 +110,120 @@ class BeaconFinder:
             self.sensors.append(GridPoint(x1, y1))
             self.beacons.append(GridPoint(x2, y2))
 
-    def solve_part1(self, y: int) -> int:
-        blocked = set()
-        for sensor, beacon in zip(self.sensors, self.beacons, strict=False):
-            for point in sensor.ball_slice(beacon, y):
-                blocked.add(point)
-        return len(blocked)
+        self.radii = [
+            s.dist(b) for s, b in zip(self.sensors, self.beacons, strict=True)
+        ]
+
+    @property
+    def ranges(self) -> list[tuple[int, int, int]]:
+        return [
+            (sensor.x, sensor.y, radius)
+            for sensor, radius in zip(self.sensors, self.radii, strict=True)
+        ]
+
+    def row_intervals(self, y: int) -> list[tuple[int, int]]:
+        """Return the merged intervals of x values in row y that are covered
+        by at least one sensor."""
+        return covered_intervals(self.ranges, y)
+
+    def is_covered(self, point: GridPoint) -> bool:
+        return any(
+            sensor.dist(point) <= radius
+            for sensor, radius in zip(self.sensors, self.radii, strict=True)
+        )
+
+    def solve_part1(self, y: int = ROW) -> int:
+        covered = sum(hi - lo + 1 for lo, hi in self.row_intervals(y))
+        # Beacons are always inside the covered area of their sensor
+        beacons = {beacon.x for beacon in self.beacons if beacon.y == y}
+        return covered - len(beacons)
+
+    def perimeter_candidates(self, limits: Limits) -> Iterator[GridPoint]:
+        """Iterate over the intersections of the lines just outside of the
+        sensors' ranges.
+
+        A single uncovered point has to be adjacent to the ranges of several
+        sensors, so it lies on the intersection of two such diagonal lines
+        x - y = a and x + y = b (unless it is at the edge of the limits).
+        """
+        ascending, descending = set(), set()
+        for sensor, radius in zip(self.sensors, self.radii, strict=True):
+            for d in (-radius - 1, radius + 1):
+                ascending.add(sensor.x - sensor.y + d)
+                descending.add(sensor.x + sensor.y + d)
+
+        for a in ascending:
+            for b in descending:
+                if (a + b) % 2 == 0:
+                    point = GridPoint((a + b) // 2, (b - a) // 2)
+                    if (
+                        limits.xmin <= point.x <= limits.xmax
+                        and limits.ymin <= point.y <= limits.ymax
+                    ):
+                        yield point
 
-    def solve_part2(self, limits: Limits) -> int:
-        dists = [
-            s.dist(b) for s, b in zip(self.sensors, self.beacons, strict=False)
+    def sweep(
+        self, limits: Limits, max_workers: int | None = None
+    ) -> GridPoint | None:
+        """Sweep over all rows within limits using a pool of processes.
+
+        The day modules are loaded from their files (see aoc.runner), so a
+        pool can only call find_gap in child processes that inherit the
+        module, i.e. with the fork start method. Elsewhere, the rows are
+        swept in this process.
+        """
+        ranges = self.ranges
+        if "fork" not in multiprocessing.get_all_start_methods():
+            point = find_gap(
+                ranges,
+                limits.xmin,
+                limits.xmax,
+                range(limits.ymin, limits.ymax + 1),
+            )
+            return None if point is None else GridPoint(*point)
+
+        max_workers = max_workers or os.cpu_count() or 1
+        n_rows = limits.ymax - limits.ymin + 1
+        chunk_size = -(-n_rows // max_workers)
+        chunks = [
+            range(y, min(y + chunk_size, limits.ymax + 1))
+            for y in range(limits.ymin, limits.ymax + 1, chunk_size)
         ]
-        x, y = limits.xmin, limits.ymin
-
-        while y <= limits.ymax:
-            for sensor, radius in zip(self.sensors, dists, strict=False):
-                if sensor.dist(GridPoint(x, y)) <= radius:
-                    # Move x to the right side of the current sensor's ball
-                    x = sensor.x + radius - abs(sensor.y - y) + 1
-                    if x > limits.xmax:
-                        x = limits.xmin
-                        y += 1
-                    break
-            else:
-                print(f"Distress beacon found at {(x, y)}")
-                return x * 4_000_000 + y
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("fork"),
+        ) as executor:
+            futures = [
+                executor.submit(
+                    find_gap, ranges, limits.xmin, limits.xmax, rows
+                )
+                for rows in chunks
+            ]
+            for future in futures:
+                if (point := future.result()) is not None:
+                    return GridPoint(*point)
+        return None
+
+    def solve_part2(self, limits: Limits = LIMITS) -> int:
+        for point in self.perimeter_candidates(limits):
+            if not self.is_covered(point):
+                break
+        else:
+            # The point is at the edge of the limits
+            point = self.sweep(limits)
+            if point is None:
+                raise ValueError("No uncovered point within limits")
+        return point.x * 4_000_000 + point.y
 
 
 if __name__ == "__main__":
     test_finder = BeaconFinder(test_content)
     assert test_finder.solve_part1(y=10) == 26
     assert test_finder.solve_part2(Limits(0, 20, 0, 20)) == 56_000_011
+    assert test_finder.sweep(Limits(0, 20, 0, 20)) == (14, 11)
 
     file = Path(__file__).parent / "input.txt"
     content = file.read_text()
     finder = BeaconFinder(content)
-    print(f"Part 1: {finder.solve_part1(y=2_000_000)}")
-    print(f"Part 2: {finder.solve_part2(Limits(0, 4_000_000, 0, 4_000_000))}")
+    print(f"Part 1: {finder.solve_part1()}")
+    print(f"Part 2: {finder.solve_part2()}")
@@ -1,7 +1,6 @@
 """Day 17: Pyroclastic Flow"""
 
 from collections.abc import Iterator
-from dataclasses import dataclass
 from itertools import cycle
 from pathlib import Path
 from typing import NamedTuple
@@ -27,53 +26,29 @@ ROCK_SHAPES = """
 """
 
 
-class GridPoint(NamedTuple):
-    x: int
-    y: int
+# Number of rows at the top of the pile that are used to detect cycles
+SURFACE_DEPTH = 64
 
-    def __add__(self, other: "GridPoint") -> "GridPoint":
-        return GridPoint(self.x + other.x, self.y + other.y)
 
-
-@dataclass
-class Rock:
-    points: set[GridPoint]
-
-    @property
-    def height(self) -> int:
-        return max(point.y for point in self.points)
-
-    @property
-    def y(self) -> int:
-        return min(point.y for point in self.points)
-
-    @property
-    def columns(self) -> dict[int, int]:
-        x_vals = {p.x for p in self.points}
-        return {x: max(p.y for p in self.points if p.x == x) for x in x_vals}
-
-    @classmethod
-    def from_shape(cls, shape: str) -> "Rock":
-        points = set()
-        rows = shape.strip().split("\n")
-        for y, row in enumerate(reversed(rows)):
-            for x, val in enumerate(row):
-                if val == "#":
-                    points.add(GridPoint(x, y))
-        return cls(points=points)
-
-    def __add__(self, other: GridPoint) -> "Rock":
-        return Rock(points={point + other for point in self.points})
-
-    def push(self, pattern: str) -> "Rock":
-        return self + GridPoint(1 if pattern == ">" else -1, 0)
+def parse_rock(shape: str, width: int) -> tuple[int, ...]:
+    """Convert a rock shape into bitmasks of its rows (from bottom to top),
+    where bit width - 1 is the leftmost column. Rocks appear two units away
+    from the left wall."""
+    rows = []
+    for row in reversed(shape.strip().split("\n")):
+        mask = 0
+        for x, val in enumerate(row, start=2):
+            if val == "#":
+                mask |= 1 << (width - 1 - x)
+        rows.append(mask)
+    return tuple(rows)
 
 
 class State(NamedTuple):
     rock_idx: int
     pattern_idx: int
     height: int
-    column_heights: tuple[int, ...]
+    surface: bytes
 
 
 class RockFall:
@@ -83,60 +58,64 @@ class RockFall:
         self._patterns = content.strip()
         self._rocks = self._initialize_rocks()
 
-    def _initialize_rocks(self) -> list[Rock]:
+    def _initialize_rocks(self) -> list[tuple[int, ...]]:
         shapes = ROCK_SHAPES.strip().split("\n\n")
-        return [Rock.from_shape(shape) for shape in shapes]
+        return [parse_rock(shape, self.width) for shape in shapes]
 
     def stack(self) -> Iterator[State]:
-        pile = {GridPoint(x, 0) for x in range(self.width)}
-        rocks = enumerate(cycle(self._rocks))
-        patterns = enumerate(cycle(self._patterns))
-        column_heights = tuple(0 for _ in range(self.width))
+        """Simulate the falling rocks and yield the state after each rock.
+
+        The pile is stored as one bitmask per row, so rocks are moved by
+        shifting their row masks and collisions are detected with a bitwise
+        AND.
+        """
+        # Row 0 is the first row above the floor
+        pile = bytearray()
+        left_wall = 1 << (self.width - 1)
+        right_wall = 1
+        patterns = self._patterns
+        pattern_idx = 0
         height = 0
 
-        while True:
-            rock_idx, rock = next(rocks)
-            rock += GridPoint(2, height + 4)
+        def collides(rock: tuple[int, ...], y: int) -> bool:
+            for row, mask in enumerate(rock, start=y):
+                if row < height and pile[row] & mask:
+                    return True
+            return False
+
+        for rock_idx, rock in enumerate(cycle(self._rocks)):
+            y = height + 3
 
-            pattern_counter = 0
             while True:
                 # Push rock sideways
-                pattern_idx, pattern = next(patterns)
-                new_rock = rock.push(pattern)
-                pattern_counter += 1
-                if all(
-                    0 <= p.x <= self.width - 1 for p in new_rock.points
-                ) and (
-                    new_rock.y > height or new_rock.points.isdisjoint(pile)
-                ):
-                    rock = new_rock
+                if patterns[pattern_idx] == ">":
+                    if not any(mask & right_wall for mask in rock):
+                        pushed = tuple(mask >> 1 for mask in rock)
+                        if not collides(pushed, y):
+                            rock = pushed
+                else:
+                    if not any(mask & left_wall for mask in rock):
+                        pushed = tuple(mask << 1 for mask in rock)
+                        if not collides(pushed, y):
+                            rock = pushed
+                pattern_idx = (pattern_idx + 1) % len(patterns)
                 # Move rock downward
-                new_rock = rock + GridPoint(0, -1)
-                if new_rock.y <= height and not new_rock.points.isdisjoint(
-                    pile
-                ):
+                if y == 0 or collides(rock, y - 1):
                     break
-                rock = new_rock
-
-            # Update height
-            height = max(rock.height, height)
-            # Update heights of each column in pile
-            column_heights = tuple(
-                max(y, rock.columns.get(x, y))
-                for x, y in enumerate(column_heights)
-            )
-            # Normalize column heights by subtracting the current height
-            normalized_column_heights = tuple(
-                y - height for y in column_heights
-            )
-            # Add rock to pile
-            pile.update(rock.points)
+                y -= 1
+
+            # Add rock to pile and update height
+            for row, mask in enumerate(rock, start=y):
+                if row == len(pile):
+                    pile.append(0)
+                pile[row] |= mask
+            height = len(pile)
 
             yield State(
                 rock_idx=rock_idx,
                 pattern_idx=pattern_idx,
                 height=height,
-                column_heights=normalized_column_heights,
+                surface=bytes(pile[-SURFACE_DEPTH:]),
             )
 
     def solve_part1(self) -> int:
@@ -148,28 +127,30 @@ class RockFall:
     def solve_part2(self) -> int:
         n_rocks = 1_000_000_000_000
         history = {}
-        simulation = self.stack()
+        heights = []
+
+        for state in self.stack():
+            heights.append(state.height)
+            if len(heights) == n_rocks:
+                return state.height
 
-        while True:
-            state = next(simulation)
             key = (
                 state.rock_idx % len(self._rocks),
-                state.pattern_idx % len(self._patterns),
-                state.column_heights,
+                state.pattern_idx,
+                state.surface,
             )
             if key in history:
                 old_state = history[key]
-                # Number of rocks between current and old state
-                step_size = state.rock_idx - old_state.rock_idx
-                # Number of steps that can be skipped
-                steps = (n_rocks - old_state.rock_idx) // step_size - 1
-                # Number of missing steps to fully cover n_rocks
-                missing = n_rocks % (steps * step_size) - state.rock_idx - 1
-                for _ in range(missing):
-                    height = next(simulation).height
-                return height + steps * (state.height - old_state.height)
-            else:
-                history[key] = state
+                # Number of rocks and height gained per cycle
+                cycle_length = state.rock_idx - old_state.rock_idx
+                cycle_height = state.height - old_state.height
+                # Skip as many full cycles as possible and look up the height
+                # gained by the remaining rocks from the first cycle
+                n_cycles, rest = divmod(n_rocks - len(heights), cycle_length)
+                rest_height = heights[old_state.rock_idx + rest]
+                rest_height -= old_state.height
+                return state.height + n_cycles * cycle_height + rest_height
+            history[key] = state
 
 
 if __name__ == "__main__":
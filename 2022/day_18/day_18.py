@@ -1,9 +1,9 @@
 """Day 18: Boiling Boulders"""
 
 from collections import deque
-from collections.abc import Iterator
 from pathlib import Path
-from typing import NamedTuple
+
+from aoc.parse import ints
 
 test_content = """
 2,2,2
@@ -22,71 +22,76 @@ test_content = """
 """
 
 
-class Cube(NamedTuple):
-    x: int
-    y: int
-    z: int
-
-    def neighbors(self) -> set["Cube"]:
-        x, y, z = self
-        neighbors = {Cube(x + d, y, z) for d in (-1, 1)}
-        neighbors.update({Cube(x, y + d, z) for d in (-1, 1)})
-        neighbors.update({Cube(x, y, z + d) for d in (-1, 1)})
-        return neighbors
+# Translate voxels (0: empty, 1: filled) into a binary number
+VOXEL_BITS = bytes.maketrans(b"\x00\x01", b"01")
+# Voxels reached by the flood fill from outside the droplet
+EXTERIOR = 2
+# Fill all voxels that are not exterior
+FILL_INTERIOR = bytes.maketrans(b"\x00\x01\x02", b"\x01\x01\x00")
 
 
 class LavaDroplet:
     def __init__(self, content: str):
-        self.lava = self._process_input(content)
-
-    def _process_input(self, content: str) -> set[Cube]:
-        content = content.strip().split("\n")
-        return {Cube(*eval(row)) for row in content}
-
-    @staticmethod
-    def get_surface_area(cubes: set[Cube]) -> int:
-        total_surface = 0
+        cubes = [ints(row) for row in content.strip().split("\n")]
+        # Add a layer of padding around the bounding box, such that the
+        # exterior is connected and neighbors never wrap around into the
+        # droplet
+        self.origin = [min(cube[i] for cube in cubes) - 1 for i in range(3)]
+        nx, ny, nz = (
+            max(cube[i] for cube in cubes) - self.origin[i] + 2
+            for i in range(3)
+        )
+        self.shape = (nx, ny, nz)
+        # Index offsets of the neighbors along the x, y and z axes
+        self.offsets = (ny * nz, nz, 1)
+
+        self.lava = bytearray(nx * ny * nz)
         for cube in cubes:
-            neighbors = cube.neighbors()
-            total_surface += len(neighbors.difference(cubes))
-        return total_surface
+            self.lava[self.index(*cube)] = 1
+
+    def index(self, x: int, y: int, z: int) -> int:
+        x0, y0, z0 = self.origin
+        _, ny, nz = self.shape
+        return ((x - x0) * ny + (y - y0)) * nz + (z - z0)
+
+    def get_surface_area(self, voxels: bytearray) -> int:
+        """Count the sides of filled voxels that are not shared with another
+        filled voxel."""
+        # Shifting the voxels (as bits of a single integer) by the offset of
+        # an axis aligns each voxel with its neighbor on that axis
+        bits = int(voxels.translate(VOXEL_BITS), 2)
+        n_shared = sum(
+            (bits & (bits >> offset)).bit_count() for offset in self.offsets
+        )
+        return 6 * bits.bit_count() - 2 * n_shared
 
     def solve_part1(self) -> int:
         return self.get_surface_area(self.lava)
 
     def solve_part2(self) -> int:
-        cubes = self.flodd_fill()
-        return self.get_surface_area(cubes)
-
-    def _get_ranges(self) -> list[Iterator[int]]:
-        components = [[cube[i] for cube in self.lava] for i in range(3)]
-        return [range(min(vals) - 1, max(vals) + 2) for vals in components]
+        droplet = self.flood_fill().translate(FILL_INTERIOR)
+        return self.get_surface_area(droplet)
 
-    def flodd_fill(self) -> set[Cube]:
-        """Find all exterior cubes starting at a point outside the droplet."""
-        x_vals, y_vals, z_vals = self._get_ranges()
-        cubes = {Cube(x, y, z) for x in x_vals for y in y_vals for z in z_vals}
+    def flood_fill(self) -> bytearray:
+        """Mark all voxels outside the droplet, starting in a corner."""
+        voxels = self.lava.copy()
+        n = len(voxels)
+        offsets = [*self.offsets, *(-offset for offset in self.offsets)]
 
         queue = deque()
-        # Start at minimum cube (which is always on the outside of the droplet)
-        queue.append(min(cubes))
-        # Mark all lava cubes as already visited
-        visited = self.lava.copy()
+        queue.append(0)
+        voxels[0] = EXTERIOR
 
         while queue:
-            cube = queue.popleft()
-            # Mark current cube as visited
-            visited.add(cube)
-            # Get neighbors (inside the limits)
-            neighbors = cube.neighbors().intersection(cubes)
-            # Remove already visited points from neighbors
-            neighbors.difference_update(visited)
-            # Add neighbors (that are not already in the queue) to queue
-            queue.extend(neighbors.difference(queue))
-
-        interior_points = {cube for cube in cubes if cube not in visited}
-
-        return self.lava.union(interior_points)
+            i = queue.popleft()
+            for offset in offsets:
+                j = i + offset
+                if 0 <= j < n and voxels[j] == 0:
+                    # Mark voxel as visited when it is added to the queue
+                    voxels[j] = EXTERIOR
+                    queue.append(j)
+
+        return voxels
 
 
 if __name__ == "__main__":
@@ -1,8 +1,8 @@
 """Day 21: Monkey Math"""
 
 import operator
-import re
 from collections.abc import Callable
+from fractions import Fraction
 from pathlib import Path
 from typing import NamedTuple
 
@@ -25,95 +25,121 @@ hmdt: 32
 """
 
 
-class Operation(NamedTuple):
+Number = int | Fraction
+
+
+def divide(a: Number, b: Number) -> Number:
+    """Exact division, which only falls back to fractions when needed."""
+    if isinstance(a, int) and isinstance(b, int) and a % b == 0:
+        return a // b
+    return Fraction(a, b)
+
+
+OPERATORS: dict[str, Callable[[Number, Number], Number]] = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": divide,
+}
+
+
+class Job(NamedTuple):
     a: str
+    op: str
     b: str
-    op: Callable[[int, int], int | float]
-
-    def apply(self, results: dict[str, int]) -> int | float | None:
-        a = results.get(self.a, None)
-        b = results.get(self.b, None)
-        if a is None or b is None:
-            return None
-        else:
-            return self.op(a, b)
 
 
 class RootFinder:
-    results: dict[str, int]
-    operations: dict[str, Operation]
+    numbers: dict[str, int]
+    jobs: dict[str, Job]
 
     def __init__(self, content: str):
-        self.content = content.strip().split("\n")
-
-    def _parse_input(self, humn: int | None = None) -> None:
-        self.results = {}
-        self.operations = {}
-        for row in self.content:
+        self.numbers = {}
+        self.jobs = {}
+        for row in content.strip().split("\n"):
             key, val = row.split(": ")
-            if re.match(r"\d+", val):
-                val = int(val) if humn is None or key != "humn" else humn
-                self.results[key] = val
+            if val.lstrip("-").isdigit():
+                self.numbers[key] = int(val)
             else:
-                a, op_, b = val.split(" ")
-                if humn is not None and key == "root":
-                    op = operator.sub  # Compute a - b
-                else:
-                    match op_:
-                        case "+":
-                            op = operator.add
-                        case "-":
-                            op = operator.sub
-                        case "*":
-                            op = operator.mul
-                        case "/":
-                            op = operator.truediv
-                self.operations[key] = Operation(a, b, op)
-
-    def root(self, humn: int | None = None) -> int | float:
-        self._parse_input(humn=humn)
-        while self.results.get("root", None) is None:
-            for key, op in self.operations.copy().items():
-                result = op.apply(self.results)
-                if result is not None:
-                    self.operations.pop(key)
-                    self.results[key] = result
-        return self.results["root"]
-
-    @staticmethod
-    def sign(x: int | float) -> int:
-        return 1 if x >= 0 else -1
+                self.jobs[key] = Job(*val.split(" "))
+        self.order = self._topological_order()
+
+    def _topological_order(self) -> list[str]:
+        """Order the monkeys with jobs, such that every monkey comes after
+        the monkeys it is waiting for."""
+        order = []
+        visited = set()
+        # Iterative depth-first search, as the trees can be very deep
+        stack = [("root", False)]
+        while stack:
+            key, expanded = stack.pop()
+            if expanded:
+                order.append(key)
+            elif key in self.jobs and key not in visited:
+                visited.add(key)
+                stack.append((key, True))
+                job = self.jobs[key]
+                stack.append((job.b, False))
+                stack.append((job.a, False))
+        return order
+
+    def evaluate(self) -> dict[str, Number]:
+        """Compute the numbers yelled by all monkeys in a single pass."""
+        values: dict[str, Number] = dict(self.numbers)
+        for key in self.order:
+            a, op, b = self.jobs[key]
+            values[key] = OPERATORS[op](values[a], values[b])
+        return values
 
     def solve_part1(self) -> int:
-        return int(self.root())
+        value = self.evaluate()["root"]
+        if value != int(value):
+            raise ValueError(f"root would yell {value}")
+        return int(value)
 
     def solve_part2(self) -> int:
-        # We want to find the point humn, where root(humn) == 0.
-        # To do that, we are going to apply the bisection method.
-
-        # 1) Find feasible lower and upper limits:
-        lower, upper = 1, 10  # initial guesses
-        f_lower, f_upper = self.root(lower), self.root(upper)
-        # Find upper value with sign(root(upper)) != sign(root(lower))
-        while self.sign(f_lower) == self.sign(f_upper):
-            upper *= 10
-            f_upper = self.root(upper)
-
-        # 2) Bisection
-        while True:
-            center = (lower + upper) // 2
-            f_center = self.root(center)
-            if abs(f_center) < 1e-6:
-                # Root was found
-                humn = center
-                break
-            # Update limits
-            if self.sign(f_center) == self.sign(self.root(lower)):
-                lower = center
+        values = self.evaluate()
+        # Find all monkeys whose numbers depend on humn
+        unknown = {"humn"}
+        for key in self.order:
+            a, _, b = self.jobs[key]
+            if a in unknown or b in unknown:
+                unknown.add(key)
+
+        # Root checks for equality, i.e. the unknown side of root has to
+        # yell the number of the known side
+        a, _, b = self.jobs["root"]
+        key, target = (a, values[b]) if a in unknown else (b, values[a])
+
+        # Invert the operations along the path from root to humn
+        while key != "humn":
+            a, op, b = self.jobs[key]
+            if a in unknown:
+                key, known = a, values[b]
+                match op:
+                    case "+":
+                        target -= known
+                    case "-":
+                        target += known
+                    case "*":
+                        target = divide(target, known)
+                    case "/":
+                        target *= known
             else:
-                upper = center
-
-        return humn
+                key, known = b, values[a]
+                match op:
+                    case "+":
+                        target -= known
+                    case "-":
+                        target = known - target
+                    case "*":
+                        target = divide(target, known)
+                    case "/":
+                        target = divide(known, target)
+
+        if target != int(target):
+            raise ValueError(f"humn would have to yell {target}")
+        return int(target)
 
 
 if __name__ == "__main__":
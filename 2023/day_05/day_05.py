@@ -1,7 +1,10 @@
 """Day 5: You Give A Seed A Fertilizer"""
 
 import math
+from bisect import bisect_right
+from functools import reduce
 from pathlib import Path
+from typing import NamedTuple, Self
 
 test_content = """
 seeds: 79 14 55 13
@@ -40,6 +43,66 @@ humidity-to-location map:
 """
 
 
+class Mapping(NamedTuple):
+    """Piecewise linear function on the non-negative integers, which maps x
+    to x + offsets[k] for starts[k] <= x < starts[k + 1]. The last piece
+    extends to infinity."""
+
+    starts: list[int]
+    offsets: list[int]
+
+    @classmethod
+    def from_ranges(cls, ranges: list[tuple[int, int, int]]) -> Self:
+        """Create mapping from (dest_start, source_start, length) triples.
+        Numbers outside all source ranges are mapped to themselves."""
+        starts, offsets = [0], [0]
+        for dest_start, source_start, length in sorted(
+            ranges, key=lambda x: x[1]
+        ):
+            if source_start == starts[-1]:
+                offsets[-1] = dest_start - source_start
+            else:
+                starts.append(source_start)
+                offsets.append(dest_start - source_start)
+            starts.append(source_start + length)
+            offsets.append(0)
+        return cls(starts, offsets)
+
+    def __call__(self, x: int) -> int:
+        return x + self.offsets[bisect_right(self.starts, x) - 1]
+
+    def then(self, other: Self) -> Self:
+        """Compose two mappings, i.e. return x -> other(self(x))."""
+        starts, offsets = [], []
+        stops = [*self.starts[1:], math.inf]
+        for start, stop, offset in zip(
+            self.starts, stops, self.offsets, strict=True
+        ):
+            # Split the image of the current piece at the breakpoints of
+            # other
+            first = bisect_right(other.starts, start + offset) - 1
+            starts.append(start)
+            offsets.append(offset + other.offsets[first])
+            for j in range(first + 1, len(other.starts)):
+                if other.starts[j] >= stop + offset:
+                    break
+                starts.append(other.starts[j] - offset)
+                offsets.append(offset + other.offsets[j])
+        return type(self)(starts, offsets)
+
+    def minimum(self, start: int, stop: int) -> int:
+        """Return the minimum of the mapping on range(start, stop)."""
+        # Each piece is increasing, so the minimum is attained at the start
+        # of one of the pieces
+        first = bisect_right(self.starts, start) - 1
+        result = start + self.offsets[first]
+        for k in range(first + 1, len(self.starts)):
+            if self.starts[k] >= stop:
+                break
+            result = min(result, self.starts[k] + self.offsets[k])
+        return result
+
+
 class Puzzle:
     def __init__(self, content: str):
         content = content.strip().split("\n\n")
@@ -49,57 +112,25 @@ class Puzzle:
 
         mappings = [mapping.split(":\n")[1] for mapping in content[1:]]
         self.mappings = [self._parse_map(mapping) for mapping in mappings]
+        # Compose all mappings to get from seed to location directly
+        self.location = reduce(Mapping.then, self.mappings)
 
-    def _parse_map(self, mapping_input: str) -> dict[range, range]:
-        mapping = {}
+    def _parse_map(self, mapping_input: str) -> Mapping:
+        ranges = []
         for line in mapping_input.strip().split("\n"):
             dest_start, source_start, length = map(int, line.split())
-            dest_range = range(dest_start, dest_start + length)
-            source_range = range(source_start, source_start + length)
-            mapping[source_range] = dest_range
-        return mapping
-
-    def _get_location(self, seed: int) -> tuple[int, int]:
-        item = seed
-        next_change = math.inf
-        for mapping in self.mappings:
-            found_in_range = False
-
-            for source, dest in mapping.items():
-                if item in source:
-                    next_change = min(next_change, source.stop - item)
-                    item = dest[source.index(item)]
-                    found_in_range = True
-                    break
-
-            if not found_in_range:
-                closest = math.inf
-                for source in mapping.keys():
-                    if source.start > item:
-                        closest = min(closest, source.start - item)
-                next_change = min(next_change, closest)
-
-        return item, next_change
+            ranges.append((dest_start, source_start, length))
+        return Mapping.from_ranges(ranges)
 
     def solve_part1(self) -> int:
-        locations = [self._get_location(seed)[0] for seed in self.seeds]
-        return min(locations)
+        return min(self.location(seed) for seed in self.seeds)
 
     def solve_part2(self) -> int:
-        seed_ranges = [
-            range(a, a + b)
-            for a, b in zip(self.seeds[0::2], self.seeds[1::2], strict=False)
-        ]
-        locations = []
-
-        for seed_range in seed_ranges:
-            seed = seed_range.start
-            while seed <= seed_range.stop:
-                location, next_change = self._get_location(seed)
-                locations.append(location)
-                seed += next_change
-
-        return min(locations)
+        seed_ranges = zip(self.seeds[0::2], self.seeds[1::2], strict=True)
+        return min(
+            self.location.minimum(start, start + length)
+            for start, length in seed_ranges
+        )
 
 
 if __name__ == "__main__":
@@ -2,7 +2,8 @@
 
 from collections import deque
 from pathlib import Path
-from typing import NamedTuple, Self
+
+from aoc.grid import DOWN, LEFT, RIGHT, UP, Grid, opposite
 
 test_content = """
 ..F7.
@@ -39,63 +40,40 @@ L7JLJL-JLJLJL--JLJ.L
 """
 
 
-class Point(NamedTuple):
-    x: int
-    y: int
-
-    def __add__(self, other: Self) -> Self:
-        return Point(self.x + other.x, self.y + other.y)
-
-
-UP = Point(0, -1)
-DOWN = Point(0, 1)
-LEFT = Point(-1, 0)
-RIGHT = Point(1, 0)
-
 DIRECTIONS = {
-    "|": (UP, DOWN),
-    "-": (LEFT, RIGHT),
-    "L": (UP, RIGHT),
-    "J": (UP, LEFT),
-    "7": (DOWN, LEFT),
-    "F": (DOWN, RIGHT),
-    "S": (UP, DOWN, LEFT, RIGHT),
-    ".": (),
+    ord("|"): (UP, DOWN),
+    ord("-"): (LEFT, RIGHT),
+    ord("L"): (UP, RIGHT),
+    ord("J"): (UP, LEFT),
+    ord("7"): (DOWN, LEFT),
+    ord("F"): (DOWN, RIGHT),
+    ord("S"): (UP, DOWN, LEFT, RIGHT),
+    ord("."): (),
 }
 
 
 class Puzzle:
     def __init__(self, content: str):
-        content = content.strip().split("\n")
-        self.nx = len(content[0])
-        self.ny = len(content)
-        self.points = {}
-        for y, line in enumerate(content):
-            for x, type_ in enumerate(line):
-                point = Point(x, y)
-                self.points[point] = type_
-                if type_ == "S":
-                    self.start = point
-
-    def visit_all(self) -> dict[Point, int]:
+        self.grid = Grid.from_text(content)
+        self.start = self.grid.find("S")
+
+    def visit_all(self) -> dict[int, int]:
+        grid = self.grid
         queue = deque()
         queue.append((self.start, 0))
-        # Store visited points and the smallest number of steps to reach them
+        # Store visited cells and the smallest number of steps to reach them
         visited = {self.start: 0}
 
         while queue:
-            p0, n = queue.popleft()
+            i0, n = queue.popleft()
             n += 1
-            for direction in DIRECTIONS[self.points[p0]]:
-                p1 = p0 + direction
-                if p1 not in visited:
-                    type_ = self.points.get(p1)
-                    if type_ is not None and type_ != ".":
-                        # Check if we can go back to p0 from p1
-                        neighbors = [p1 + d for d in DIRECTIONS[type_]]
-                        if p0 in neighbors:
-                            queue.append((p1, n))
-                            visited[p1] = n
+            for direction in DIRECTIONS[grid[i0]]:
+                i1 = grid.step(i0, direction)
+                if i1 is not None and i1 not in visited:
+                    # Check if we can go back to i0 from i1
+                    if opposite(direction) in DIRECTIONS[grid[i1]]:
+                        queue.append((i1, n))
+                        visited[i1] = n
 
         return visited
 
@@ -105,16 +83,17 @@ class Puzzle:
 
     def solve_part2(self) -> int:
         visited = self.visit_all()
+        grid = self.grid
+        crossings = b"|JL"
         total = 0
 
-        for y in range(self.ny):
+        for y in range(grid.height):
             inside = False
-            for x in range(self.nx - 1):
-                p = Point(x, y)
-                type_ = self.points.get(p)
-                if p in visited and type_ in ("|", "J", "L"):
-                    inside = not inside
-                if inside and p not in visited:
+            for i in range(grid.index(0, y), grid.index(grid.width - 1, y)):
+                if i in visited:
+                    if grid[i] in crossings:
+                        inside = not inside
+                elif inside:
                     total += 1
 
         return total
@@ -57,7 +57,7 @@ class Puzzle:
         galaxies = self.init_galaxies()
         return self.compute_total_dists(galaxies)
 
-    def solve_part2(self, expansion: int) -> int:
+    def solve_part2(self, expansion: int = 1_000_000) -> int:
         galaxies = self.init_galaxies(expansion=expansion)
         return self.compute_total_dists(galaxies)
 
@@ -72,4 +72,4 @@ if __name__ == "__main__":
     content = file.read_text()
     puzzle = Puzzle(content)
     print(f"Part 1: {puzzle.solve_part1()}")
-    print(f"Part 2: {puzzle.solve_part2(expansion=1_000_000)}")
+    print(f"Part 2: {puzzle.solve_part2()}")
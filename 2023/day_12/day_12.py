@@ -43,6 +43,70 @@ def distinct_permutations(iterable):
         items[i + 1 :] = items[: i - size : -1]  # A[i + 1:][::-1]
 
 
+def count_brute_force(pattern: str, counts: list[int]) -> int:
+    """Count arrangements by trying every possible assignment of the unknown
+    springs. Only feasible for short patterns."""
+    regex = r"^\.*"
+    regex += r"\.+".join(f"#{{{count}}}" for count in counts)
+    regex += r"\.*$"
+
+    n_missing = pattern.count("?")
+    n_damaged = sum(counts) - pattern.count("#")
+    set_ = "#" * n_damaged + "." * (n_missing - n_damaged)
+
+    total = 0
+    for permutation in distinct_permutations(set_):
+        x = pattern
+        for char in permutation:
+            x = x.replace("?", char, 1)
+        if re.match(regex, x):
+            total += 1
+    return total
+
+
+def count_arrangements(pattern: str, counts: list[int]) -> int:
+    """Count arrangements with dynamic programming over the position in the
+    pattern and the index of the next group, which takes
+    O(len(pattern) * len(counts)) steps."""
+    n = len(pattern)
+    # Index of the first damaged spring at or after each position
+    next_damaged = [n] * (n + 1)
+    # Number of consecutive springs at each position that may be damaged
+    run_length = [0] * (n + 1)
+    for i in range(n - 1, -1, -1):
+        next_damaged[i] = i if pattern[i] == "#" else next_damaged[i + 1]
+        run_length[i] = 0 if pattern[i] == "." else run_length[i + 1] + 1
+
+    # Number of arrangements of pattern[i:] with the groups counts[j:],
+    # filled from the end of the pattern (a group may end right before it, so
+    # the table has a row for position n + 1 as well)
+    m = len(counts)
+    table = [[0] * (m + 1) for _ in range(n + 2)]
+    for i in range(n + 1, -1, -1):
+        # Valid only if there are no damaged springs left
+        table[i][m] = int(next_damaged[min(i, n)] == n)
+        if i >= n:
+            continue
+        row = table[i]
+        for j in range(m):
+            total = 0
+            if pattern[i] != "#":
+                # Spring is operational
+                total += table[i + 1][j]
+            if pattern[i] != ".":
+                # Spring starts the next group of damaged springs, which must
+                # be followed by an operational spring (or the end of the
+                # pattern)
+                end = i + counts[j]
+                if run_length[i] >= counts[j] and (
+                    end == n or pattern[end] != "#"
+                ):
+                    total += table[end + 1][j + 1]
+            row[j] = total
+
+    return table[0][0]
+
+
 class Puzzle:
     def __init__(self, content: str):
         self.conditions = []
@@ -52,35 +116,27 @@ class Puzzle:
             self.conditions.append((pattern, counts))
 
     def solve_part1(self) -> int:
-        total = 0
-
-        for condition in self.conditions:
-            pattern, counts = condition
-            regex = r"^\.*"
-            regex += r"\.+".join(f"#{{{count}}}" for count in counts)
-            regex += r"\.*$"
-
-            n_missing = pattern.count("?")
-            n_damaged = sum(counts) - pattern.count("#")
-            set_ = "#" * n_damaged + "." * (n_missing - n_damaged)
-
-            for permutation in distinct_permutations(set_):
-                x = pattern
-                for char in permutation:
-                    x = x.replace("?", char, 1)
-                if re.match(regex, x):
-                    total += 1
-
-        return total
+        return sum(
+            count_arrangements(pattern, counts)
+            for pattern, counts in self.conditions
+        )
 
     def solve_part2(self) -> int:
-        return 2
+        # Unfold the records by repeating them five times
+        return sum(
+            count_arrangements("?".join([pattern] * 5), counts * 5)
+            for pattern, counts in self.conditions
+        )
 
 
 if __name__ == "__main__":
     test_puzzle = Puzzle(test_content)
     assert test_puzzle.solve_part1() == 21
-    assert test_puzzle.solve_part2() == 2
+    assert test_puzzle.solve_part2() == 525_152
+    for condition in test_puzzle.conditions:
+        assert count_arrangements(*condition) == count_brute_force(*condition)
+    # Long records must not be limited by the recursion depth
+    assert count_arrangements("?" * 5000, [1, 1]) == 4999 * 4998 // 2
 
     file = Path(__file__).parent / "input.txt"
     content = file.read_text()
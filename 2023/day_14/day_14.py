@@ -2,6 +2,8 @@
 
 from pathlib import Path
 
+from aoc.grid import DOWN, LEFT, RIGHT, UP, Grid
+
 test_content = """
 O....#....
 O.OO#....#
@@ -15,84 +17,76 @@ O.#..O.#.#
 #OO..#....
 """
 
-StringTuple = tuple[str, ...]
-
-
-def transpose(x: StringTuple) -> StringTuple:
-    return tuple("".join(line[i] for line in x) for i in range(len(x[0])))
 
+def roll(line: bytearray) -> bytearray:
+    """Move all round rocks to the start of the line until they hit a cube
+    rock."""
+    segments = line.split(b"#")
+    for i, segment in enumerate(segments):
+        n_rocks = segment.count(b"O")
+        segments[i] = b"O" * n_rocks + b"." * (len(segment) - n_rocks)
+    return bytearray(b"#").join(segments)
 
-def flip(x: StringTuple) -> StringTuple:
-    return tuple(line[::-1] for line in x)
 
+def tilt(grid: Grid, direction: int) -> None:
+    """Tilt the grid in place, such that all round rocks roll in
+    direction."""
+    cells = grid.cells
+    if direction in (UP, DOWN):
+        lines = [grid.column(x) for x in range(grid.width)]
+    else:
+        lines = [grid.row(y) for y in range(grid.height)]
 
-def move(x: StringTuple) -> StringTuple:
-    lines = []
-    for line in x:
-        old_line = ""
-        while line != old_line:
-            old_line = line
-            line = line.replace(".O", "O.")
-        lines.append(line)
-    return tuple(lines)
+    for line in lines:
+        if direction in (UP, LEFT):
+            cells[line] = roll(cells[line])
+        else:
+            cells[line] = roll(cells[line][::-1])[::-1]
 
 
-def cycle(rows: StringTuple) -> StringTuple:
-    # Tilt north
-    cols = transpose(rows)
-    cols = move(cols)
-    # Tilt west
-    rows = transpose(cols)
-    rows = move(rows)
-    # Tilt south
-    cols = flip(transpose(rows))
-    cols = flip(move(cols))
-    # Tilt east
-    rows = flip(transpose(cols))
-    rows = flip(move(rows))
-    return rows
+def cycle(grid: Grid) -> None:
+    for direction in (UP, LEFT, DOWN, RIGHT):
+        tilt(grid, direction)
 
 
-def get_load(cols: StringTuple) -> int:
-    total = 0
-    for col in cols:
-        count = 0
-        for x in col[::-1]:
-            count += 1
-            if x == "O":
-                total += count
-    return total
+def get_load(grid: Grid) -> int:
+    """Sum the distances of all round rocks to the south edge."""
+    return sum(
+        grid.height - grid.coordinates(i)[1] for i in grid.find_all("O")
+    )
 
 
 class Puzzle:
     def __init__(self, content: str):
-        self.rows = tuple(content.strip().split("\n"))
+        self.grid = Grid.from_text(content)
 
     def solve_part1(self) -> int:
-        cols = transpose(self.rows)
-        cols = move(cols)
-        return get_load(cols)
+        # Tilting works in place, so every part works on its own copy
+        grid = self.grid.copy()
+        tilt(grid, UP)
+        return get_load(grid)
 
     def solve_part2(self) -> int:
         n_cycles = 1_000_000_000
-        rows = self.rows
+        grid = self.grid.copy()
         seen = {}
         i = 0
 
         while True:
             i += 1
-            rows = cycle(rows)
-            if rows in seen:
-                start = seen[rows]
+            cycle(grid)
+            state = bytes(grid.cells)
+            if state in seen:
+                start = seen[state]
                 diff = i - start
                 n_missing = (n_cycles - start) % diff
                 break
-            seen[rows] = i
+            seen[state] = i
 
         for _ in range(n_missing):
-            rows = cycle(rows)
+            cycle(grid)
 
-        return get_load(transpose(rows))
+        return get_load(grid)
 
 
 if __name__ == "__main__":
@@ -2,7 +2,8 @@
 
 from collections import deque
 from pathlib import Path
-from typing import NamedTuple, Self
+
+from aoc.grid import DOWN, LEFT, RIGHT, UP, Grid
 
 test_content = r"""
 .|...\....
@@ -18,80 +19,55 @@ test_content = r"""
 """
 
 
-class Point(NamedTuple):
-    x: int
-    y: int
-
-    def __add__(self, other: Self) -> Self:
-        return Point(self.x + other.x, self.y + other.y)
+# Outgoing directions of a beam for each type of cell and incoming direction
+BEAMS = {
+    ord("."): [(d,) for d in range(4)],
+    ord("/"): [(RIGHT,), (UP,), (LEFT,), (DOWN,)],
+    ord("\\"): [(LEFT,), (DOWN,), (RIGHT,), (UP,)],
+    ord("-"): [(LEFT, RIGHT), (RIGHT,), (LEFT, RIGHT), (LEFT,)],
+    ord("|"): [(UP,), (UP, DOWN), (DOWN,), (UP, DOWN)],
+}
 
 
 class Puzzle:
     def __init__(self, content: str):
-        rows = content.strip().split("\n")
-        self.nx = len(rows[0])
-        self.ny = len(rows)
-        self.mirrors = {}
-        for y, row in enumerate(rows):
-            for x, val in enumerate(row):
-                if val != ".":
-                    self.mirrors[Point(x, y)] = val
-
-    def move(self, start: Point, direction: Point) -> int:
+        self.grid = Grid.from_text(content)
+
+    def move(self, start: int, direction: int) -> int:
+        grid = self.grid
         queue = deque()
         # Store current position and direction in queue
         queue.append((start, direction))
-        visited = set()
-        beams = set()
+        # Store the directions of the beams passing through each cell as bits
+        beams = bytearray(len(grid))
 
         while queue:
-            p, d = queue.popleft()
-            if (p, d) in beams:
+            i, d = queue.popleft()
+            if beams[i] & (1 << d):
                 continue
-            beams.add((p, d))
-
-            if 0 <= p.x < self.nx and 0 <= p.y < self.ny:
-                visited.add(p)
-                mirror = self.mirrors.get(p)
-                if not mirror:
-                    queue.append((p + d, d))
-                else:
-                    directions = []
-
-                    match mirror:
-                        case "/":
-                            directions = [Point(-d.y, -d.x)]
-                        case "\\":
-                            directions = [Point(d.y, d.x)]
-                        case "-":
-                            if d.y == 0:
-                                directions = [d]
-                            else:
-                                directions = [Point(-1, 0), Point(1, 0)]
-                        case "|":
-                            if d.x == 0:
-                                directions = [d]
-                            else:
-                                directions = [Point(0, -1), Point(0, 1)]
-
-                    for d in directions:
-                        queue.append((p + d, d))
-
-        return len(visited)
+            beams[i] |= 1 << d
+
+            for new_d in BEAMS[grid[i]][d]:
+                j = grid.step(i, new_d)
+                if j is not None:
+                    queue.append((j, new_d))
+
+        return len(beams) - beams.count(0)
 
     def solve_part1(self) -> int:
-        return self.move(Point(0, 0), Point(1, 0))
+        return self.move(0, RIGHT)
 
     def solve_part2(self) -> int:
+        grid = self.grid
         n_max = 0
 
-        for x in range(self.nx):
-            n_max = max(n_max, self.move(Point(x, 0), Point(0, 1)))
-            n_max = max(n_max, self.move(Point(x, self.ny - 1), Point(0, -1)))
+        for x in range(grid.width):
+            n_max = max(n_max, self.move(grid.index(x, 0), DOWN))
+            n_max = max(n_max, self.move(grid.index(x, grid.height - 1), UP))
 
-        for y in range(self.ny):
-            n_max = max(n_max, self.move(Point(0, y), Point(1, 0)))
-            n_max = max(n_max, self.move(Point(self.nx - 1, y), Point(-1, 0)))
+        for y in range(grid.height):
+            n_max = max(n_max, self.move(grid.index(0, y), RIGHT))
+            n_max = max(n_max, self.move(grid.index(grid.width - 1, y), LEFT))
 
         return n_max
 
@@ -1,8 +1,9 @@
 """Day 17: Clumsy Crucible"""
 
 from pathlib import Path
-from queue import PriorityQueue
-from typing import NamedTuple, Self
+
+from aoc.grid import Grid
+from aoc.pathfinding import constrained_shortest_path
 
 test_content = """
 2413432311323
@@ -20,106 +21,20 @@ test_content = """
 4322674655533
 """
 
-
-class Point(NamedTuple):
-    x: int
-    y: int
-
-    def __add__(self, other: Self) -> Self:
-        return Point(self.x + other.x, self.y + other.y)
-
-
-class State(NamedTuple):
-    position: Point
-    direction: Point
-    count: int
-
-
-DIRECTIONS = {
-    Point(1, 0): (Point(1, 0), Point(0, 1), Point(0, -1)),
-    Point(-1, 0): (Point(-1, 0), Point(0, 1), Point(0, -1)),
-    Point(0, 1): (Point(0, 1), Point(1, 0), Point(-1, 0)),
-    Point(0, -1): (Point(0, -1), Point(1, 0), Point(-1, 0)),
-}
+HEAT_LOSS = bytes.maketrans(b"0123456789", bytes(range(10)))
 
 
 class Puzzle:
     def __init__(self, content: str):
-        rows = content.strip().split("\n")
-        self.points = {}
-        for y, row in enumerate(rows):
-            for x, val in enumerate(row):
-                self.points[Point(x, y)] = int(val)
-        self.xmax = max(p.x for p in self.points)
-        self.ymax = max(p.y for p in self.points)
+        self.grid = Grid.from_text(content)
+        # Convert digits to heat loss values
+        self.grid.cells[:] = self.grid.cells.translate(HEAT_LOSS)
 
     def solve_part1(self) -> int:
-        start_pos = Point(0, 0)
-        end_pos = Point(self.xmax, self.ymax)
-        queue = PriorityQueue()
-        queue.put((0, State(start_pos, Point(0, 1), 0)))
-        queue.put((0, State(start_pos, Point(1, 0), 0)))
-        seen = set()
-
-        min_heat_loss = 0
-
-        while not queue.empty():
-            heat_loss, state = queue.get()
-            if state in seen:
-                continue
-            seen.add(state)
-
-            if state.position == end_pos:
-                min_heat_loss = heat_loss
-                break
-
-            for direction in DIRECTIONS[state.direction]:
-                count = state.count + 1 if direction == state.direction else 1
-                if count > 3:
-                    continue
-                new_pos = state.position + direction
-                if 0 <= new_pos.x <= self.xmax and 0 <= new_pos.y <= self.ymax:
-                    new_state = State(new_pos, direction, count)
-                    new_heat_loss = heat_loss + self.points[new_pos]
-                    queue.put((new_heat_loss, new_state))
-
-        return min_heat_loss
+        return constrained_shortest_path(self.grid, min_run=1, max_run=3)
 
     def solve_part2(self) -> int:
-        start_pos = Point(0, 0)
-        end_pos = Point(self.xmax, self.ymax)
-        queue = PriorityQueue()
-        queue.put((0, State(start_pos, Point(0, 1), 0)))
-        queue.put((0, State(start_pos, Point(1, 0), 0)))
-        seen = set()
-
-        min_heat_loss = 0
-
-        while not queue.empty():
-            heat_loss, state = queue.get()
-            # print((heat_loss, state))
-            if state in seen:
-                continue
-            seen.add(state)
-
-            if state.position == end_pos:
-                min_heat_loss = heat_loss
-                break
-
-            for direction in DIRECTIONS[state.direction]:
-                if direction != state.direction and state.count < 4:
-                    continue
-                count = state.count + 1 if direction == state.direction else 1
-                if count > 10:
-                    continue
-
-                new_pos = state.position + direction
-                if 0 <= new_pos.x <= self.xmax and 0 <= new_pos.y <= self.ymax:
-                    new_state = State(new_pos, direction, count)
-                    new_heat_loss = heat_loss + self.points[new_pos]
-                    queue.put((new_heat_loss, new_state))
-
-        return min_heat_loss
+        return constrained_shortest_path(self.grid, min_run=4, max_run=10)
 
 
 if __name__ == "__main__":
@@ -5,6 +5,8 @@ from collections import deque
 from pathlib import Path
 from typing import NamedTuple, Self
 
+from aoc.grid import Grid
+
 test_content = """
 R 6 (#70c710)
 D 5 (#0dc571)
@@ -33,11 +35,6 @@ class Point(NamedTuple):
     def __mul__(self, other: int) -> Self:
         return Point(self.x * other, self.y * other)
 
-    def neighbors(self) -> set[Self]:
-        neighbors = {Point(self.x + d, self.y) for d in (-1, 1)}
-        neighbors |= {Point(self.x, self.y + d) for d in (-1, 1)}
-        return neighbors
-
 
 DIRECTIONS = {
     "U": Point(0, -1),
@@ -47,27 +44,29 @@ DIRECTIONS = {
 }
 
 
-def flood_fill(border: set[Point]) -> set[Point]:
-    xs = range(min(p.x for p in border) - 1, max(p.x for p in border) + 2)
-    ys = range(min(p.y for p in border) - 1, max(p.y for p in border) + 2)
-    points = {Point(x, y) for x in xs for y in ys}
-    start = Point(xs.start, ys.start)
+def flood_fill(border: list[Point]) -> int:
+    """Count the cells inside and on the border."""
+    xmin = min(p.x for p in border) - 1
+    ymin = min(p.y for p in border) - 1
+    width = max(p.x for p in border) - xmin + 2
+    height = max(p.y for p in border) - ymin + 2
+    grid = Grid(width, height)
+    for p in border:
+        grid[grid.index(p.x - xmin, p.y - ymin)] = ord("#")
 
+    # Start in the corner, which is always outside (due to the padding)
     queue = deque()
-    queue.append(start)
-    outside = set()
+    queue.append(0)
+    grid[0] = ord("~")
 
     while queue:
-        p = queue.popleft()
-        outside.add(p)
-        neighbors = p.neighbors()
-        neighbors.difference_update(queue)
-        for pn in neighbors:
-            if pn in points and pn not in border and pn not in outside:
-                queue.append(pn)
+        i = queue.popleft()
+        for j in grid.neighbors(i):
+            if grid[j] == ord("."):
+                grid[j] = ord("~")
+                queue.append(j)
 
-    interior = {p for p in points if p not in outside}
-    return interior
+    return len(grid) - grid.cells.count(b"~")
 
 
 class Puzzle:
@@ -76,13 +75,12 @@ class Puzzle:
 
     def solve_part1(self) -> int:
         point = Point(0, 0)
-        border = {point}
+        border = [point]
         for direction, distance, _ in self.instructions:
             for _ in range(int(distance)):
                 point += DIRECTIONS[direction]
-                border.add(point)
-        interior = flood_fill(border)
-        return len(interior)
+                border.append(point)
+        return flood_fill(border)
 
     def solve_part2(self) -> int:
         point = Point(0, 0)
@@ -1,6 +1,9 @@
+import argparse
 import sys
 from pathlib import Path
 
+from aoc import bench, runner
+
 TEMPLATE = '''"""Day %d: TODO: CHANGE TITLE"""
 
 from pathlib import Path
@@ -45,8 +48,126 @@ def _add_day(year: int, day: int) -> None:
     file.write_text(TEMPLATE % day)
 
 
+def _run(year: int | None, days: list[int], max_workers: int | None) -> int:
+    days_ = runner.discover(year, days)
+    if not days_:
+        print("No solutions found.")
+        return 1
+
+    n_errors = 0
+    for result in runner.run(days_, max_workers=max_workers):
+        print(f"{result.day} ({result.elapsed:.2f}s)")
+        if result.error is not None:
+            n_errors += 1
+            print(f"  Error: {result.error}")
+        for part, answer in enumerate(result.answers, start=1):
+            answer = str(answer).rstrip("\n")
+            sep = "\n" if "\n" in answer else " "
+            print(f"  Part {part}:{sep}{answer}")
+
+    return 1 if n_errors else 0
+
+
+def _bench(
+    year: int | None,
+    days: list[int],
+    repeat: int,
+    warmup: int,
+    history_file: Path,
+) -> int:
+    days_ = runner.discover(year, days)
+    if not days_:
+        print("No solutions found.")
+        return 1
+
+    history = bench.read_history(history_file)
+    records = []
+    n_errors = 0
+    for day in days_:
+        print(day)
+        # Like in runner.solve, a broken day must not abort the whole
+        # benchmark and lose the results of the other days
+        try:
+            measurements = bench.benchmark(day, repeat=repeat, warmup=warmup)
+        except Exception as exc:
+            n_errors += 1
+            print(f"  Error: {type(exc).__name__}: {exc}")
+            continue
+        record = bench.to_record(day, measurements, repeat, warmup)
+        previous = bench.last_record(history, day)
+        records.append(record)
+
+        for m in measurements:
+            line = (
+                f"  {m.phase:<6} {bench.format_time(m.median):>9} "
+                f"(best {bench.format_time(m.best)}, "
+                f"peak {bench.format_memory(m.peak_memory)})"
+            )
+            if previous is not None and m.phase in previous["phases"]:
+                old = previous["phases"][m.phase]["median"]
+                if old > 0:
+                    line += f" {(m.median - old) / old:+.0%}"
+                    line += f" vs {previous['commit'] or 'previous run'}"
+            print(line)
+
+    bench.append_history(records, history_file)
+    return 1 if n_errors else 0
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m aoc")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    new = subparsers.add_parser("new", help="initialize a new day")
+    new.add_argument("year", type=int)
+    new.add_argument("day", type=int)
+
+    run = subparsers.add_parser("run", help="solve one or more days")
+    run.add_argument("year", type=int, nargs="?")
+    run.add_argument("days", type=int, nargs="*")
+    run.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="number of worker processes (default: number of CPUs)",
+    )
+
+    bench_ = subparsers.add_parser(
+        "bench", help="benchmark parsing and solving of one or more days"
+    )
+    bench_.add_argument("year", type=int, nargs="?")
+    bench_.add_argument("days", type=int, nargs="*")
+    bench_.add_argument(
+        "-n", "--repeat", type=int, default=5, help="number of timed rounds"
+    )
+    bench_.add_argument(
+        "-w", "--warmup", type=int, default=1, help="number of warmup rounds"
+    )
+    bench_.add_argument(
+        "--history",
+        type=Path,
+        default=bench.HISTORY_FILE,
+        help="JSON lines file the results are appended to",
+    )
+
+    return parser.parse_args()
+
+
 if __name__ == "__main__":
-    args = sys.argv
-    if len(args) != 3:
-        raise ValueError("Please pass YEAR and DAY as command-line arguments.")
-    _add_day(int(args[1]), int(args[2]))
+    args = _parse_args()
+    match args.command:
+        case "new":
+            _add_day(args.year, args.day)
+        case "run":
+            sys.exit(_run(args.year, args.days, args.jobs))
+        case "bench":
+            sys.exit(
+                _bench(
+                    args.year,
+                    args.days,
+                    args.repeat,
+                    args.warmup,
+                    args.history,
+                )
+            )
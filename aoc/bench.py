@@ -0,0 +1,154 @@
+"""Benchmark parsing and solving of puzzles and keep a history of results."""
+
+import json
+import platform
+import statistics
+import subprocess
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from aoc.runner import PARTS, ROOT, Day, get_puzzle_class, load_module
+
+HISTORY_FILE = ROOT / "bench_history.jsonl"
+
+
+class Measurement(NamedTuple):
+    phase: str  # "parse", "part1", "part2"
+    times: list[float]
+    peak_memory: int
+
+    @property
+    def best(self) -> float:
+        return min(self.times)
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.times)
+
+
+def _timed(func: Callable[[], Any]) -> tuple[Any, float]:
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def _traced(func: Callable[[], Any]) -> tuple[Any, int]:
+    tracemalloc.start()
+    try:
+        result = func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, peak
+
+
+def benchmark(day: Day, repeat: int = 5, warmup: int = 1) -> list[Measurement]:
+    """Time parsing and each part of a day separately.
+
+    Every round creates a new puzzle instance from the input, followed by
+    solving all parts on that instance. Memory is measured in an additional
+    round, as tracing allocations slows down the code considerably.
+    """
+    puzzle_class = get_puzzle_class(load_module(day))
+    content = day.input_file.read_text()
+    phases = ["parse"] + [
+        f"part{part}"
+        for part in PARTS
+        if hasattr(puzzle_class, f"solve_part{part}")
+    ]
+
+    def round_(
+        measure: Callable[[Callable[[], Any]], tuple[Any, Any]],
+    ) -> list[Any]:
+        puzzle, value = measure(lambda: puzzle_class(content))
+        values = [value]
+        for phase in phases[1:]:
+            _, value = measure(getattr(puzzle, f"solve_{phase}"))
+            values.append(value)
+        return values
+
+    for _ in range(warmup):
+        round_(_timed)
+    times = [round_(_timed) for _ in range(repeat)]
+    peaks = round_(_traced)
+
+    return [
+        Measurement(phase, [t[i] for t in times], peaks[i])
+        for i, phase in enumerate(phases)
+    ]
+
+
+def _git_commit() -> str | None:
+    try:
+        process = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return process.stdout.strip()
+
+
+def to_record(
+    day: Day, measurements: list[Measurement], repeat: int, warmup: int
+) -> dict[str, Any]:
+    return {
+        "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "year": day.year,
+        "day": day.day,
+        "repeat": repeat,
+        "warmup": warmup,
+        "phases": {
+            m.phase: {
+                "best": m.best,
+                "median": m.median,
+                "peak_memory": m.peak_memory,
+            }
+            for m in measurements
+        },
+    }
+
+
+def read_history(file: Path = HISTORY_FILE) -> list[dict[str, Any]]:
+    if not file.exists():
+        return []
+    with file.open() as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def append_history(
+    records: list[dict[str, Any]], file: Path = HISTORY_FILE
+) -> None:
+    with file.open("a") as f:
+        for record in records:
+            f.write(json.dumps(record) + "\n")
+
+
+def last_record(
+    history: list[dict[str, Any]], day: Day
+) -> dict[str, Any] | None:
+    """Return the most recent record of day in history."""
+    for record in reversed(history):
+        if (record["year"], record["day"]) == day:
+            return record
+    return None
+
+
+def format_time(seconds: float) -> str:
+    for unit, factor in (("s", 1), ("ms", 1e-3)):
+        if seconds >= factor:
+            return f"{seconds / factor:.2f}{unit}"
+    return f"{seconds / 1e-6:.0f}us"
+
+
+def format_memory(n_bytes: int) -> str:
+    return f"{n_bytes / 2**20:.1f}MiB"
@@ -0,0 +1,110 @@
+"""Compact two-dimensional grids backed by a flat bytearray."""
+
+from collections.abc import Iterator
+from typing import Self
+
+# Directions in clockwise order, i.e. turning right is (d + 1) % 4 and turning
+# around is (d + 2) % 4
+UP, RIGHT, DOWN, LEFT = range(4)
+DX = (0, 1, 0, -1)
+DY = (-1, 0, 1, 0)
+
+
+def opposite(direction: int) -> int:
+    return (direction + 2) % 4
+
+
+class Grid:
+    """Rectangular grid of single-byte cells.
+
+    The cells are stored row by row in one bytearray and addressed by their
+    index y * width + x, so no object has to be allocated per cell. Rows and
+    columns are available as slices of the cells, which can also be assigned
+    to.
+    """
+
+    def __init__(self, width: int, height: int, fill: bytes = b"."):
+        self.width = width
+        self.height = height
+        self.cells = bytearray(fill * (width * height))
+        # Index offsets of the neighboring cells in each direction
+        self.offsets = (-width, 1, width, -1)
+
+    @classmethod
+    def from_text(cls, content: str) -> Self:
+        rows = content.strip().split("\n")
+        grid = cls(len(rows[0]), len(rows))
+        grid.cells[:] = "".join(rows).encode()
+        return grid
+
+    def copy(self) -> Self:
+        grid = type(self)(self.width, self.height)
+        grid.cells[:] = self.cells
+        return grid
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def __getitem__(self, index: int) -> int:
+        return self.cells[index]
+
+    def __setitem__(self, index: int, value: int) -> None:
+        self.cells[index] = value
+
+    def __str__(self) -> str:
+        return "\n".join(row.decode() for row in self.rows())
+
+    def index(self, x: int, y: int) -> int:
+        return y * self.width + x
+
+    def coordinates(self, index: int) -> tuple[int, int]:
+        y, x = divmod(index, self.width)
+        return x, y
+
+    def contains(self, x: int, y: int) -> bool:
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def step(
+        self, index: int, direction: int, distance: int = 1
+    ) -> int | None:
+        """Move distance cells in direction. Return None if the new position
+        is outside the grid."""
+        y, x = divmod(index, self.width)
+        x += DX[direction] * distance
+        y += DY[direction] * distance
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return y * self.width + x
+        return None
+
+    def neighbors(self, index: int) -> Iterator[int]:
+        """Iterate over the indices of the (up to four) adjacent cells."""
+        y, x = divmod(index, self.width)
+        if y > 0:
+            yield index - self.width
+        if x < self.width - 1:
+            yield index + 1
+        if y < self.height - 1:
+            yield index + self.width
+        if x > 0:
+            yield index - 1
+
+    def row(self, y: int) -> slice:
+        return slice(y * self.width, (y + 1) * self.width)
+
+    def column(self, x: int) -> slice:
+        return slice(x, None, self.width)
+
+    def rows(self) -> Iterator[bytearray]:
+        for y in range(self.height):
+            yield self.cells[self.row(y)]
+
+    def find(self, value: str) -> int:
+        """Return the index of the first cell containing value."""
+        return self.cells.index(value.encode())
+
+    def find_all(self, value: str) -> Iterator[int]:
+        char = value.encode()
+        index = self.cells.find(char)
+        while index != -1:
+            yield index
+            index = self.cells.find(char, index + 1)
@@ -0,0 +1,185 @@
+"""Fast and safe parsers for puzzle inputs, which do not rely on eval."""
+
+import operator
+import re
+from collections.abc import Callable
+from typing import Any, NamedTuple
+
+INTEGERS = re.compile(r"-?\d+")
+LIST_TOKENS = re.compile(r"-?\d+|[\[\]]")
+EXPRESSION_TOKENS = re.compile(r"\s*(?:(\d+)|([A-Za-z_]\w*)|(//|[-+*()]))")
+
+OPERATORS = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "//": operator.floordiv,
+}
+
+
+def ints(text: str) -> list[int]:
+    """Extract all (possibly negative) integers from text."""
+    return [int(x) for x in INTEGERS.findall(text)]
+
+
+def nested_list(text: str) -> Any:
+    """Parse a (nested) list of integers like '[1,[2,[]],3]'."""
+    stack = []
+    result = None
+    for token in LIST_TOKENS.findall(text):
+        if result is not None:
+            raise ValueError(f"Unexpected '{token}' after list in '{text}'")
+        if token == "[":
+            stack.append([])
+        elif not stack:
+            raise ValueError(f"Unexpected '{token}' outside of list '{text}'")
+        elif token == "]":
+            items = stack.pop()
+            if stack:
+                stack[-1].append(items)
+            else:
+                result = items
+        else:
+            stack[-1].append(int(token))
+    if stack:
+        raise ValueError(f"Unbalanced brackets: '{text}'")
+    if result is None:
+        raise ValueError(f"No list found in '{text}'")
+    return result
+
+
+class _Node(NamedTuple):
+    """Compiled sub-expression, which is either a constant or a function of
+    the variable."""
+
+    func: Callable[[int], int] | None = None
+    value: int | None = None
+
+
+_IDENTITY = _Node(func=lambda x: x)
+
+
+def _combine(op: Callable[[int, int], int], a: _Node, b: _Node) -> _Node:
+    # Fold constants and avoid calling nested functions for the most common
+    # cases (e.g. 'old * 19' or 'old * old')
+    if a.func is None and b.func is None:
+        return _Node(value=op(a.value, b.value))
+    if a is _IDENTITY and b is _IDENTITY:
+        return _Node(func=lambda x: op(x, x))
+    if a is _IDENTITY and b.func is None:
+        c = b.value
+        return _Node(func=lambda x: op(x, c))
+    if a.func is None and b is _IDENTITY:
+        c = a.value
+        return _Node(func=lambda x: op(c, x))
+    f = a.func or (lambda _, c=a.value: c)
+    g = b.func or (lambda _, c=b.value: c)
+    return _Node(func=lambda x: op(f(x), g(x)))
+
+
+def compile_expression(
+    expression: str, variable: str = "x"
+) -> Callable[[int], int]:
+    """Compile an integer expression of a single variable into a function.
+
+    Supported are integer literals, the variable, parentheses and the binary
+    operators +, -, * and // (with the usual precedence).
+    """
+    tokens = []
+    pos = 0
+    expression = expression.strip()
+    while pos < len(expression):
+        match = EXPRESSION_TOKENS.match(expression, pos)
+        if match is None:
+            raise ValueError(f"Invalid expression: '{expression}'")
+        tokens.append(match.group(match.lastindex))
+        pos = match.end()
+    tokens.append(None)  # end marker
+    pos = 0
+
+    def peek() -> str | None:
+        return tokens[pos]
+
+    def take() -> str | None:
+        nonlocal pos
+        pos += 1
+        return tokens[pos - 1]
+
+    def parse_sum() -> _Node:
+        node = parse_product()
+        while peek() in ("+", "-"):
+            op = OPERATORS[take()]
+            node = _combine(op, node, parse_product())
+        return node
+
+    def parse_product() -> _Node:
+        node = parse_atom()
+        while peek() in ("*", "//"):
+            op = OPERATORS[take()]
+            node = _combine(op, node, parse_atom())
+        return node
+
+    def parse_atom() -> _Node:
+        token = take()
+        if token == "(":
+            node = parse_sum()
+            if take() != ")":
+                raise ValueError(f"Unbalanced parentheses: '{expression}'")
+            return node
+        if token == variable:
+            return _IDENTITY
+        if token is not None and token.isdigit():
+            return _Node(value=int(token))
+        raise ValueError(f"Unexpected token '{token}' in '{expression}'")
+
+    node = parse_sum()
+    if peek() is not None:
+        raise ValueError(f"Unexpected token '{peek()}' in '{expression}'")
+    if node.func is None:
+        value = node.value
+        return lambda _: value
+    return node.func
+
+
+if __name__ == "__main__":
+    # Measure the throughput of the parsers on large generated inputs
+    import random
+    import time
+
+    random.seed(0)
+
+    def random_list(depth: int = 0) -> str:
+        items = [
+            random_list(depth + 1)
+            if depth < 4 and random.random() < 0.3
+            else str(random.randint(0, 99))
+            for _ in range(random.randint(0, 5))
+        ]
+        return "[" + ",".join(items) + "]"
+
+    operations = ["old * 19", "old + 6", "old * old", "(old + 3) * 2 - 1"]
+    inputs = {
+        "ints": (
+            ints,
+            [
+                ",".join(str(random.randint(-99, 99)) for _ in range(3))
+                for _ in range(200_000)
+            ],
+        ),
+        "nested_list": (
+            nested_list,
+            [random_list() for _ in range(50_000)],
+        ),
+        "compile_expression": (
+            lambda line: compile_expression(line, "old"),
+            [random.choice(operations) for _ in range(100_000)],
+        ),
+    }
+
+    for name, (parser, lines) in inputs.items():
+        size = sum(len(line) + 1 for line in lines) / 2**20
+        start = time.perf_counter()
+        for line in lines:
+            parser(line)
+        elapsed = time.perf_counter() - start
+        print(f"{name:<20} {size:6.1f}MiB {size / elapsed:8.1f}MiB/s")
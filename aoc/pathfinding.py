@@ -0,0 +1,84 @@
+"""Shortest paths on grids of small positive integer weights."""
+
+from array import array
+
+from aoc.grid import Grid
+
+# Axis of the last move of a state
+VERTICAL, HORIZONTAL = 0, 1
+
+
+def constrained_shortest_path(
+    grid: Grid,
+    min_run: int,
+    max_run: int,
+    start: int = 0,
+    end: int | None = None,
+) -> int:
+    """Find the minimal cost to get from start to end (default: bottom right
+    corner), where the cost of entering a cell is its value.
+
+    Every move has to go straight for min_run to max_run cells and must be
+    followed by a turn to the left or right. Hence, a state is described by
+    its cell and the axis it was entered on, and the moves from a state are
+    whole straight runs along the other axis.
+
+    As all weights are small integers, a Dial bucket queue is used instead
+    of a heap: Costs only grow and never by more than max_weight * max_run
+    per move, so a ring of that many buckets indexed by cost suffices.
+    """
+    cells = grid.cells
+    width, height = grid.width, grid.height
+    end = len(cells) - 1 if end is None else end
+
+    n_states = 2 * len(cells)
+    unreachable = sum(cells) + 1
+    costs = array("q", [unreachable]) * n_states
+    done = bytearray(n_states)
+
+    n_buckets = max(cells) * max_run + 1
+    buckets = [[] for _ in range(n_buckets)]
+    for axis in (VERTICAL, HORIZONTAL):
+        costs[2 * start + axis] = 0
+        buckets[0].append(2 * start + axis)
+    n_queued = 2
+    cost = 0
+
+    while n_queued:
+        bucket = buckets[cost % n_buckets]
+        while bucket:
+            state = bucket.pop()
+            n_queued -= 1
+            if done[state] or costs[state] != cost:
+                # State was already expanded with a smaller cost
+                continue
+            done[state] = 1
+
+            cell, axis = divmod(state, 2)
+            if cell == end:
+                return cost
+
+            y, x = divmod(cell, width)
+            if axis == VERTICAL:
+                new_axis = HORIZONTAL
+                moves = ((1, width - 1 - x), (-1, x))
+            else:
+                new_axis = VERTICAL
+                moves = ((width, height - 1 - y), (-width, y))
+
+            for offset, space in moves:
+                new_cost = cost
+                new_cell = cell
+                for run in range(1, min(max_run, space) + 1):
+                    new_cell += offset
+                    new_cost += cells[new_cell]
+                    if run < min_run:
+                        continue
+                    new_state = 2 * new_cell + new_axis
+                    if new_cost < costs[new_state] and not done[new_state]:
+                        costs[new_state] = new_cost
+                        buckets[new_cost % n_buckets].append(new_state)
+                        n_queued += 1
+        cost += 1
+
+    raise ValueError("End cannot be reached from start.")
@@ -0,0 +1,115 @@
+"""Discover, load and run the puzzle solutions of all days."""
+
+import importlib.util
+import inspect
+import os
+import sys
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from types import ModuleType
+from typing import Any, NamedTuple
+
+ROOT = Path(__file__).parent.parent
+PARTS = (1, 2)
+
+
+class Day(NamedTuple):
+    year: int
+    day: int
+
+    @property
+    def name(self) -> str:
+        return f"day_{self.day:02d}"
+
+    @property
+    def path(self) -> Path:
+        return ROOT / str(self.year) / self.name
+
+    @property
+    def module_file(self) -> Path:
+        return self.path / f"{self.name}.py"
+
+    @property
+    def input_file(self) -> Path:
+        return self.path / "input.txt"
+
+    def __str__(self) -> str:
+        return f"{self.year} day {self.day:02d}"
+
+
+class Result(NamedTuple):
+    day: Day
+    answers: tuple[Any, ...]
+    elapsed: float
+    error: str | None = None
+
+
+def discover(year: int | None = None, days: Iterable[int] = ()) -> list[Day]:
+    """Find all days that have a solution and an input file."""
+    days = set(days)
+    year_pattern = str(year) if year is not None else "[0-9]" * 4
+    found = []
+    for file in ROOT.glob(f"{year_pattern}/day_[0-9][0-9]/day_[0-9][0-9].py"):
+        day = Day(int(file.parent.parent.name), int(file.stem[4:]))
+        if days and day.day not in days:
+            continue
+        if day.input_file.exists():
+            found.append(day)
+    return sorted(found)
+
+
+def load_module(day: Day) -> ModuleType:
+    # The year directories are not valid package names, so the modules are
+    # loaded directly from their files under a unique name. The module is
+    # registered, such that its objects can be pickled (e.g. when a puzzle
+    # uses a process pool itself). Note that unpickling them only works in
+    # forked children, which inherit the registered module; processes
+    # started with spawn or forkserver cannot import it by that name.
+    name = f"aoc_{day.year}_{day.name}"
+    spec = importlib.util.spec_from_file_location(name, day.module_file)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def get_puzzle_class(module: ModuleType) -> type:
+    """Return the class defined in module that implements solve_part1."""
+    for _, cls in inspect.getmembers(module, inspect.isclass):
+        if cls.__module__ == module.__name__ and hasattr(cls, "solve_part1"):
+            return cls
+    raise LookupError(f"No puzzle class found in '{module.__file__}'")
+
+
+def load_puzzle(day: Day) -> Any:
+    puzzle_class = get_puzzle_class(load_module(day))
+    return puzzle_class(day.input_file.read_text())
+
+
+def solve(day: Day) -> Result:
+    """Solve all parts of a single day.
+
+    Errors are caught and returned as part of the result, so that a single
+    broken day does not abort a full run.
+    """
+    start = time.perf_counter()
+    try:
+        puzzle = load_puzzle(day)
+        answers = tuple(
+            getattr(puzzle, f"solve_part{part}")()
+            for part in PARTS
+            if hasattr(puzzle, f"solve_part{part}")
+        )
+    except Exception as exc:
+        elapsed = time.perf_counter() - start
+        return Result(day, (), elapsed, f"{type(exc).__name__}: {exc}")
+    return Result(day, answers, time.perf_counter() - start)
+
+
+def run(days: list[Day], max_workers: int | None = None) -> Iterator[Result]:
+    """Solve days in parallel and yield results in the order of days."""
+    max_workers = min(max_workers or os.cpu_count() or 1, max(len(days), 1))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        yield from executor.map(solve, days)